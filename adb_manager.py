@@ -17,9 +17,123 @@
 import subprocess
 import sys
 import os
-import threading # Included for potential future use with long-running tasks
+import shutil
+import re
+import socket
+import time
+import queue
+import itertools
+import functools
+import concurrent.futures
+import threading # Used for logcat streaming and the persistent shell readers
+
+# Properties to try for a device display name, in order of preference.
+# Based on common properties and user's getprop output analysis.
+_DISPLAY_NAME_PROPS = (
+    'ro.product.marketname',      # Found in user's output - High priority!
+    'ro.product.vendor.marketname', # Found in user's output
+    'ro.product.odm.marketname',  # Found in user's output
+    'ro.product.system_dlkm.marketname', # Found in user's output
+    'ro.product.bootimage.marketname', # Found in user's output
+    'ro.product.display',         # Less common but might exist
+    'ro.product.name',
+    'ro.product.device',
+    'ro.product.model',           # Always available, good fallback
+    'ro.vendor.product.model',
+    'ro.system.product.model',
+    'ro.system_ext.product.model',
+    'ro.odm.product.model',
+    # Add other potential properties if known for specific devices
+)
+
+# Defaults for get_device_info results; copied per call
+_INFO_TEMPLATE = {
+    'serial': None,
+    'model': 'N/A',
+    'version': 'N/A',
+    'display_name': 'N/A', # The name we'll try to use for display
+    'battery_level': 'N/A' # Battery percentage
+}
+
+# Matches only the "[name]: [value]" lines of a 'getprop' dump that get_device_info uses,
+# so the dump is scanned once and every other property is skipped by the regex engine.
+_PROP_RE = re.compile(
+    rb'^\[(' + b'|'.join(re.escape(name.encode('ascii')) for name in _DISPLAY_NAME_PROPS + ('ro.build.version.release',))
+    + rb')\]: \[(.*)\]\s*$',
+    re.M
+)
+
+
+# One line of 'adb devices -l': serial, state and the optional description (which may contain spaces)
+_DEVICE_LINE_RE = re.compile(r'^(\S+)[ \t]+(\S+)(?:[ \t]+(.*?))?[ \t\r]*$', re.M)
+
+# The serial adb registered in the output of 'adb connect' ("connected to 192.168.1.10:5555")
+_CONNECTED_TO_RE = re.compile(r'connected to (\S+)')
+
+
+# The "level: 85" line of 'dumpsys battery'
+_BATTERY_LEVEL_RE = re.compile(rb'^\s*level:\s*(\d+)', re.M)
+
+
+# Defaults for get_package_details results; copied per call (with a fresh permissions list)
+_PACKAGE_DETAILS_TEMPLATE = {
+    'package_name': None,
+    'version_name': 'Unknown',
+    'version_code': 'Unknown',
+    'installer': 'Unknown',
+    'first_install_time': 'Unknown',
+    'last_update_time': 'Unknown',
+    'uid': 'Unknown',
+    'permissions': []
+}
+
+# 'dumpsys package' fields used by get_package_details, mapped to their details keys
+_DUMPSYS_FIELD_MAP = {
+    'versionName': 'version_name',
+    'versionCode': 'version_code',
+    'installerPackageName': 'installer',
+    'firstInstallTime': 'first_install_time',
+    'lastUpdateTime': 'last_update_time',
+    'userId': 'uid',
+}
+_DUMPSYS_FIELD_RE = re.compile(r'^[ \t]*(' + '|'.join(_DUMPSYS_FIELD_MAP) + r')=([^\r\n]*)', re.M)
+# The same fields as a device-side 'grep -E' pattern
+_DUMPSYS_FIELD_GREP = '^[[:space:]]*(' + '|'.join(_DUMPSYS_FIELD_MAP) + ')='
+
+# The "requested permissions:" block: every following line indented deeper than the header.
+# It ends at the next line with the header's indentation ("install permissions:", ...) or a blank line.
+_REQUESTED_PERMS_RE = re.compile(r'^([ \t]*)requested permissions:[ \t]*\r?\n((?:\1[ \t]+\S[^\n]*(?:\n|$))*)', re.M)
+
+
+# Modes accepted by reboot_device ("" is a normal reboot)
+_REBOOT_MODES = ("", "recovery", "bootloader", "sideload", "sideload-auto-reboot")
+
+# End-of-command marker written after each persistent-shell command: "__END_<id>__ <exit code>".
+# The exit code must be digits, so an echoed command line (on devices that allocate a pty)
+# is never mistaken for the sentinel itself.
+_SHELL_SENTINEL_RE = re.compile(rb'(__END_\d+__) (\d+)')
+
+
+@functools.lru_cache(maxsize=128)
+def _disabled_state_re(package_name):
+    """Returns the compiled regex for pm's "Package <name> new state: disabled" confirmation (cached, since the same packages are toggled repeatedly)."""
+    return re.compile(r'package\s+' + re.escape(package_name) + r'\s+new state:\s*disabled', re.I)
+
 
 class AdbManager:
+    # How long (seconds) a list_devices() result is trusted for fast-failing unknown serials
+    DEVICES_CACHE_TTL = 2.0
+    # How long (seconds) connect_device waits for a newly connected device to become ready
+    CONNECT_READY_TIMEOUT = 3.0
+    # How long (seconds) get_package_details results are reused
+    PACKAGE_DETAILS_TTL = 30.0
+    # Maximum number of logcat lines waiting for the callback before new lines are dropped
+    LOGCAT_QUEUE_SIZE = 4096
+    # Logcat lines are passed to the callback in batches of at most this many lines,
+    # collected for at most this many seconds
+    LOGCAT_BATCH_SIZE = 500
+    LOGCAT_BATCH_INTERVAL = 0.05
+
     def __init__(self, status_callback=None):
         """
         Initializes the AdbManager.
@@ -29,38 +143,86 @@ class AdbManager:
                              Expected signature: status_callback(message, level="info")
         """
         self.status_callback = status_callback
+        # Pick the status reporter once instead of checking for a callback on every update
+        self._update_status_sync = self._report_status if status_callback else self._print_status
+        # Status updates from adb calls are queued and delivered by one writer thread,
+        # so a slow status sink never holds up the thread running the command.
+        self._status_queue = queue.Queue()
+        self._status_thread = threading.Thread(target=self._status_writer, daemon=True)
+        self._status_thread.start()
+
+        # Extra arguments for every adb subprocess, resolved once since the platform never changes.
+        # On Windows, CREATE_NO_WINDOW prevents a console window popup for each command, and the
+        # STARTUPINFO asks for a hidden window in case adb creates one anyway.
+        # On POSIX nothing is added (no preexec_fn etc.), which keeps Popen on its fastest spawn path.
+        if sys.platform.startswith('win'):
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            startupinfo.wShowWindow = subprocess.SW_HIDE
+            self._popen_kwargs = {'creationflags': subprocess.CREATE_NO_WINDOW, 'startupinfo': startupinfo}
+        else:
+            self._popen_kwargs = {}
 
         # Check if 'adb' command is available in PATH on initialization
-        self._update_status("Checking for ADB command...", level="info")
+        # (reported synchronously, so the result is visible as soon as the manager exists)
+        self._update_status_sync("Checking for ADB command...", level="info")
         if not self._is_adb_available():
-             self._update_status(
+             self._update_status_sync(
                  "Error: 'adb' command not found. Please ensure Android SDK Platform-Tools are installed "
                  "and 'adb' is in your system's PATH.", level="error")
              # Set a flag to indicate adb is not available
              self.adb_available = False
         else:
              self.adb_available = True
-             self._update_status("'adb' command found.", level="info")
+             self._update_status_sync("'adb' command found.", level="info")
 
         self.logcat_process = None
         self.logcat_thread = None
+        self.logcat_dispatch_thread = None
         self._stop_logcat_event = threading.Event()
+        # Guards logcat_process / _stop_logcat_event between the GUI thread and the logcat reader
+        self._logcat_lock = threading.Lock()
+
+        # Persistent 'adb shell' sessions, one per device serial.
+        # serial -> (Popen, queue of raw output lines filled by a reader thread)
+        self._shell_procs = {}
+        # serial -> Lock, so only one command at a time is written to a given shell
+        self._shell_locks = {}
+        # Source of unique sentinel ids used to frame each command's output
+        self._shell_sentinel_ids = itertools.count(1)
+
+        # Worker pool for querying several devices at once.
+        # adb calls are I/O bound (USB/TCP round-trips), so threads overlap the waiting.
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2))
+
+        # Result of the last list_devices() call (serial -> state) and when it was taken.
+        # While it is fresh, per-device methods fail fast for serials that are not attached
+        # instead of spawning adb just to get "device not found" back.
+        self._devices_cache = {}
+        self._devices_cache_ts = 0.0
+
+        # Static properties (model, version, display name) per serial, fetched once per connection
+        self._ro_cache = {}
+
+        # Connection to the adb server's 'host:track-devices' service (a socket, or an
+        # 'adb track-devices' process; see start_device_tracking) and the last device list
+        # it pushed (None while not tracking)
+        self._track_source = None
+        self._tracked_devices = None
+
+        # (serial, package_name) -> (timestamp, details) for get_package_details
+        self._pkg_details_cache = {}
 
 
     def _is_adb_available(self):
-        """Checks if the adb command is available in the system's PATH."""
-        try:
-            # Run a simple adb command like 'version' that doesn't require a device
-            # Use short timeout as we only need to know if the command runs
-            subprocess.run(['adb', 'version'], check=True, capture_output=True, text=True, timeout=5)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-            # Command not found, or timed out trying to find/run it
-            return False
-        except Exception as e:
-             # Catch any other unexpected errors
-             print(f"An unexpected error occurred while checking for adb: {e}") # Print to console for debugging check
-             return False
+        """
+        Checks if the adb command is available in the system's PATH.
+        This is only a PATH lookup (no 'adb version' run, so startup never waits on adb).
+        The resolved absolute path is kept in self._adb_path and used for every command,
+        which skips the PATH search on each spawn and ignores later PATH changes.
+        """
+        self._adb_path = shutil.which('adb')
+        return self._adb_path is not None
 
 
     def _run_adb_command(self, command, timeout=15):
@@ -69,7 +231,7 @@ class AdbManager:
 
         Args:
             command: A list of strings representing the command and its arguments
-                     (e.g., ['adb', 'devices', '-l']).
+                     (e.g., [self._adb_path, 'devices', '-l']), or a tuple from _device_command.
             timeout: Timeout in seconds for the command.
 
         Returns:
@@ -80,41 +242,38 @@ class AdbManager:
             self._update_status("ADB is not available. Cannot run command.", level="error")
             return None, "ADB not available", 1
 
-        # Basic validation: ensure command starts with 'adb'
-        if not command or command[0].lower() != 'adb':
+        # Basic validation: ensure command starts with the resolved adb executable
+        if not command or command[0] != self._adb_path:
              self._update_status(f"Internal Error: Command does not start with 'adb': {command}", level="error")
              return None, "Invalid command format", 1
 
         try:
-            # Use creationflags=subprocess.CREATE_NO_WINDOW on Windows to prevent console window popup
-            is_windows = sys.platform.startswith('win')
-            creationflags = subprocess.CREATE_NO_WINDOW if is_windows else 0
-
             # print(f"Running command: {' '.join(command)}") # Optional: for debugging print
             result = subprocess.run(
                 command,
-                capture_output=True,
-                text=True, # Use text mode (decodes bytes to strings)
+                capture_output=True, # Raw bytes: decoded once below instead of through a text wrapper
                 timeout=timeout,
                 check=False,       # Do NOT raise CalledProcessError for non-zero exit codes
-                creationflags=creationflags
+                **self._popen_kwargs
             )
+            stdout = result.stdout.decode('utf-8', errors='replace')
+            stderr = result.stderr.decode('utf-8', errors='replace')
             # print(f"Command finished. Return code: {result.returncode}") # Optional: for debugging print
-            # print(f"STDOUT: {result.stdout.strip()}") # Optional: for debugging print
-            # print(f"STDERR: {result.stderr.strip()}") # Optional: for debugging print
+            # print(f"STDOUT: {stdout.strip()}") # Optional: for debugging print
+            # print(f"STDERR: {stderr.strip()}") # Optional: for debugging print
 
 
             # Check stderr even if returncode is 0, as ADB sometimes prints warnings/errors there
             if result.returncode != 0:
-                 error_message = result.stderr.strip() if result.stderr.strip() else f"ADB command failed with return code {result.returncode}."
+                 error_message = stderr.strip() if stderr.strip() else f"ADB command failed with return code {result.returncode}."
                  self._update_status(f"ADB Command Error: {error_message}", level="error")
-                 return result.stdout, result.stderr, result.returncode
-            elif result.stderr.strip():
+                 return stdout, stderr, result.returncode
+            elif stderr.strip():
                  # Command succeeded but had stderr output (warnings?)
-                 self._update_status(f"ADB Command Warning: {result.stderr.strip()}", level="warning")
+                 self._update_status(f"ADB Command Warning: {stderr.strip()}", level="warning")
 
 
-            return result.stdout, result.stderr, result.returncode
+            return stdout, stderr, result.returncode
 
         except FileNotFoundError:
             # This case should ideally be caught by _is_adb_available, but included for safety
@@ -128,20 +287,350 @@ class AdbManager:
             return None, str(e), 1
 
 
-    def _update_status(self, message, level="info"):
-        """Helper to call the GUI status callback if it exists."""
-        if self.status_callback:
-            # In a real application, if calling from a thread that is NOT the main GUI thread,
-            # you MUST use self.status_callback.after() to update GUI safely.
-            # Our threaded calls in main_app use .after() on the GUI side, so direct call here is okay
-            # as the main_app handles the thread safety when it receives the callback.
+    def _device_command(self, serial, *args):
+        """
+        Builds the argument tuple for an adb command aimed at one device,
+        e.g. _device_command(serial, 'reboot', 'recovery') -> (adb, '-s', serial, 'reboot', 'recovery').
+        """
+        return (self._adb_path, '-s', serial) + args
+
+
+    def _get_shell(self, serial):
+        """
+        Returns the persistent 'adb shell' session for a device, starting it if needed.
+        Must be called with the serial's shell lock held.
+
+        Returns:
+            A tuple (process, line_queue). The queue receives raw output lines (bytes),
+            and None once the shell has exited.
+        """
+        session = self._shell_procs.get(serial)
+        if session and session[0].poll() is None:
+            return session
+
+        # No command is given, so adb starts a non-interactive 'sh' reading commands from our stdin.
+        # stderr is merged into stdout so a single reader thread can drain everything.
+        process = subprocess.Popen(
+            self._device_command(serial, 'shell'),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=0,
+            **self._popen_kwargs
+        )
+        line_queue = queue.Queue()
+
+        def _shell_reader():
+            # Blocking readline is fine here: this thread only exists to feed the queue,
+            # which lets _run_shell wait for output with a timeout on every platform.
+            for raw_line in iter(process.stdout.readline, b''):
+                line_queue.put(raw_line)
+            line_queue.put(None) # Shell exited
+
+        threading.Thread(target=_shell_reader, daemon=True).start()
+        self._shell_procs[serial] = (process, line_queue)
+        return self._shell_procs[serial]
+
+
+    def _submit_shell_locked(self, serial, cmdlines):
+        """
+        Writes one or more command lines to the device's persistent shell in a single write.
+        Each command is followed by an echo of a unique sentinel and its exit code,
+        which marks the end of its output in the shared stream.
+        Caller must hold the serial's shell lock.
+
+        Returns:
+            A tuple (line_queue, sentinels) with one sentinel per command line, in order.
+
+        Raises:
+            Any exception from starting or writing to the shell (the shell is closed first).
+            A broken pipe is retried once with a new shell before giving up.
+        """
+        sentinels = [f"__END_{next(self._shell_sentinel_ids)}__" for _ in cmdlines]
+        # Reading from /dev/null keeps a command from swallowing the commands queued after it.
+        # Each command runs in a subshell, so 'exit', 'cd', exports and variable assignments
+        # stay contained instead of ending or altering the persistent session; $? is its exit status.
+        script = "".join(
+            f"( {cmdline}\n) </dev/null 2>&1\necho {sentinel} $?\n"
+            for cmdline, sentinel in zip(cmdlines, sentinels)
+        ).encode('utf-8')
+        try:
+            process, line_queue = self._get_shell(serial)
+            process.stdin.write(script)
+            process.stdin.flush()
+        except OSError:
+            # Broken pipe: the shell died since it was last used (e.g. the device reconnected).
+            # Nothing of this script ran yet, so it is safe to send it once more to a fresh shell.
+            self._close_shell_locked(serial)
+            try:
+                process, line_queue = self._get_shell(serial)
+                process.stdin.write(script)
+                process.stdin.flush()
+            except Exception:
+                self._close_shell_locked(serial)
+                raise
+        except Exception:
+            self._close_shell_locked(serial)
+            raise
+        return line_queue, sentinels
+
+
+    def _read_shell_locked(self, serial, line_queue, sentinel, deadline, timeout):
+        """
+        Yields the output lines of one submitted command until its sentinel arrives.
+        Caller must hold the serial's shell lock.
+
+        Args:
+            serial: The device serial (its shell is closed if it fails).
+            line_queue: The shell's output queue from _submit_shell_locked.
+            sentinel: The sentinel that ends this command's output.
+            deadline: time.monotonic() value after which the command has timed out.
+            timeout: The original timeout in seconds, for the status message.
+
+        Yields:
+            Output lines as bytes, without line endings.
+
+        Returns:
+            (via StopIteration.value) A tuple (returncode, error_message), see _iter_shell.
+        """
+        sentinel = sentinel.encode('ascii')
+        last_line = b''
+        while True:
             try:
-                self.status_callback(message, level)
+                raw_line = line_queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                # The shell is in an unknown state now, drop it so the next command starts clean
+                self._close_shell_locked(serial)
+                self._update_status(f"Error: ADB command timed out after {timeout} seconds.", level="error")
+                return 1, "Command timed out"
+
+            if raw_line is None:
+                # Shell exited (device gone, unauthorized, ...). adb prints the reason last.
+                self._close_shell_locked(serial)
+                error_message = last_line.decode('utf-8', errors='replace').strip() or "ADB shell exited unexpectedly."
+                self._update_status(f"ADB Command Error: {error_message}", level="error")
+                return 1, error_message
+
+            line = raw_line.rstrip(b'\r\n')
+            match = _SHELL_SENTINEL_RE.search(line)
+            if match and match.group(1) == sentinel:
+                # Output that did not end with a newline shares the sentinel's line
+                if line[:match.start()]:
+                    yield line[:match.start()]
+                return int(match.group(2)), None
+            last_line = line
+            yield line
+
+
+    def _iter_shell(self, serial, cmdline, timeout=15):
+        """
+        Runs a shell command line through the device's persistent 'adb shell' session
+        and yields its output lines as they arrive, so callers can parse (or stop) early.
+        The shell lock is held until the generator finishes; a generator closed before the
+        end of the output also closes the shell, since the rest would end up in the next command.
+
+        Args:
+            serial: The serial number or IP:port of the target device.
+            cmdline: The shell command line to run on the device.
+            timeout: Overall timeout in seconds for the command to complete.
+
+        Yields:
+            Output lines as bytes, without line endings (stderr is merged into stdout).
+
+        Returns:
+            (via StopIteration.value) A tuple (returncode, error_message). error_message is None
+            unless the shell itself failed (timeout, shell exited, write error), in which case
+            status has already been reported and returncode is 1.
+        """
+        if not self.adb_available:
+            self._update_status("ADB is not available. Cannot run command.", level="error")
+            return 1, "ADB not available"
+
+        lock = self._shell_locks.setdefault(serial, threading.Lock())
+        with lock:
+            try:
+                line_queue, (sentinel,) = self._submit_shell_locked(serial, [cmdline])
             except Exception as e:
-                 print(f"Error calling status callback: {e}") # Print if callback itself fails
-        else:
-            # Fallback to printing if no callback is provided (e.g., for testing AdbManager directly)
-            print(f"Status ({level}): {message}")
+                self._update_status(f"An unexpected error occurred while running ADB shell command: {e}", level="error")
+                return 1, str(e)
+
+            finished = False
+            try:
+                result = yield from self._read_shell_locked(serial, line_queue, sentinel, time.monotonic() + timeout, timeout)
+                finished = True
+                return result
+            finally:
+                if not finished:
+                    # Closed early: unread output would leak into the next command
+                    self._close_shell_locked(serial)
+
+
+    def _run_shell_batch(self, serial, cmdlines, timeout=15):
+        """
+        Runs several shell command lines on the device with a single write to its persistent shell,
+        then splits the combined output back per command using their sentinels.
+        One round-trip to the device replaces one per command.
+
+        Args:
+            serial: The serial number or IP:port of the target device.
+            cmdlines: A list of shell command lines.
+            timeout: Overall timeout in seconds for the whole batch.
+
+        Returns:
+            A list with one (stdout_bytes, returncode) tuple per command line, in order,
+            or None if the shell failed (status already reported).
+        """
+        if not self.adb_available:
+            self._update_status("ADB is not available. Cannot run command.", level="error")
+            return None
+
+        lock = self._shell_locks.setdefault(serial, threading.Lock())
+        with lock:
+            try:
+                line_queue, sentinels = self._submit_shell_locked(serial, cmdlines)
+            except Exception as e:
+                self._update_status(f"An unexpected error occurred while running ADB shell command: {e}", level="error")
+                return None
+
+            deadline = time.monotonic() + timeout
+            results = []
+            for sentinel in sentinels:
+                output_lines = []
+                shell_lines = self._read_shell_locked(serial, line_queue, sentinel, deadline, timeout)
+                while True:
+                    try:
+                        output_lines.append(next(shell_lines))
+                    except StopIteration as stop:
+                        returncode, error_message = stop.value
+                        break
+                if error_message is not None:
+                    return None # Shell already closed and status reported
+                results.append((b"\n".join(output_lines), returncode))
+        return results
+
+
+    def _run_shell(self, serial, cmdline, timeout=15, raw=False):
+        """
+        Runs a shell command line on the device through its persistent 'adb shell' session.
+        This avoids spawning a new adb client (and a new remote shell) for every command.
+
+        Args:
+            serial: The serial number or IP:port of the target device.
+            cmdline: The shell command line to run on the device (e.g., "getprop ro.product.model").
+            timeout: Timeout in seconds to wait for the command to complete.
+            raw: If True, stdout is returned as undecoded bytes for callers that parse bytes directly.
+
+        Returns:
+            A tuple (stdout, stderr, returncode) like _run_adb_command, or (None, error_message, 1) on failure.
+            stderr is merged into stdout, so the stderr element is always empty on success.
+        """
+        # Lines stay as bytes here; the whole output is decoded once at the end
+        output_lines = []
+        shell_lines = self._iter_shell(serial, cmdline, timeout)
+        while True:
+            try:
+                output_lines.append(next(shell_lines))
+            except StopIteration as stop:
+                returncode, error_message = stop.value
+                break
+        if error_message is not None:
+            return None, error_message, 1
+
+        stdout = b"\n".join(output_lines)
+        if returncode != 0:
+            error_message = stdout.decode('utf-8', errors='replace').strip() or f"ADB shell command failed with return code {returncode}."
+            self._update_status(f"ADB Command Error: {error_message}", level="error")
+        if not raw:
+            stdout = stdout.decode('utf-8', errors='replace')
+        return stdout, "", returncode
+
+
+    def _close_shell_locked(self, serial):
+        """Terminates the persistent shell of a device. Caller must hold the serial's shell lock."""
+        session = self._shell_procs.pop(serial, None)
+        if session:
+            process = session[0]
+            try:
+                process.stdin.close()
+            except Exception:
+                pass
+            try:
+                process.terminate()
+            except Exception:
+                pass
+
+
+    def close_shell(self, serial):
+        """Closes the persistent 'adb shell' session of a device, if any."""
+        lock = self._shell_locks.setdefault(serial, threading.Lock())
+        with lock:
+            self._close_shell_locked(serial)
+
+
+    def close(self):
+        """Releases background resources (logcat, worker pool, persistent shells, status writer). Call when the application exits."""
+        self.stop_logcat()
+        self.stop_device_tracking()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        for serial in list(self._shell_procs):
+            self.close_shell(serial)
+        # Deliver the remaining status updates, then let the writer thread end
+        self._status_queue.put(None)
+        self._status_thread.join(timeout=1)
+
+
+    def _update_status(self, message, level="info"):
+        """Queues a status update for the status writer thread (never blocks the caller)."""
+        self._status_queue.put_nowait((message, level))
+
+
+    def _status_writer(self):
+        """Delivers queued status updates in order until close() queues the None sentinel."""
+        while True:
+            item = self._status_queue.get()
+            if item is None:
+                break
+            self._update_status_sync(*item)
+
+
+    def _report_status(self, message, level="info"):
+        """Passes a status update to the GUI status callback (bound as _update_status_sync when one is given)."""
+        # In a real application, if calling from a thread that is NOT the main GUI thread,
+        # you MUST use self.status_callback.after() to update GUI safely.
+        # Our threaded calls in main_app use .after() on the GUI side, so direct call here is okay
+        # as the main_app handles the thread safety when it receives the callback.
+        try:
+            self.status_callback(message, level)
+        except Exception as e:
+             print(f"Error calling status callback: {e}") # Print if callback itself fails
+
+
+    def _print_status(self, message, level="info"):
+        """Prints a status update (bound as _update_status_sync when no callback is given, e.g. for testing AdbManager directly)."""
+        print(f"Status ({level}): {message}")
+
+
+    def _is_serial_known(self, serial):
+        """
+        Checks a serial against the cached device list before any adb process is spawned.
+        Only a fresh cache (younger than DEVICES_CACHE_TTL) can reject a serial; once it is stale,
+        every serial is allowed through and adb itself decides.
+
+        Returns:
+            False if the device is known to be absent, True otherwise.
+        """
+        if time.monotonic() - self._devices_cache_ts >= self.DEVICES_CACHE_TTL:
+            return True
+        if serial in self._devices_cache:
+            return True
+        self._update_status(f"Error: Device {serial} is not connected.", level="error")
+        return False
+
+
+    def invalidate_devices_cache(self):
+        """Forgets the cached device list, e.g. after connecting a new device."""
+        self._devices_cache_ts = 0.0
+
 
     def list_devices(self):
         """
@@ -157,40 +646,30 @@ class AdbManager:
         if not self.adb_available:
             return []
 
+        # While the adb server pushes device changes, the last pushed list is current.
+        # invalidate_devices_cache() clears the timestamp, so an explicit refresh still asks adb.
+        tracked_devices = self._tracked_devices
+        if tracked_devices is not None and self._devices_cache_ts:
+            return [dict(device) for device in tracked_devices]
+
         self._update_status("Searching for devices...", level="info")
         # Using a longer timeout for listing devices sometimes helps
         # 'adb devices -l' includes product/model/device info in the description
-        stdout, stderr, returncode = self._run_adb_command(['adb', 'devices', '-l'], timeout=20)
+        stdout, stderr, returncode = self._run_adb_command([self._adb_path, 'devices', '-l'], timeout=20)
 
         devices = []
         if returncode == 0 and stdout:
-            lines = stdout.strip().split('\n')
-            # The first line is usually "List of devices attached" - skip it if present
-            if lines and "List of devices attached" in lines[0]:
-                 lines = lines[1:]
-
-            for line in lines:
-                 line = line.strip()
-                 if not line: # Skip empty lines
-                      continue
-                 # Split into serial, state, and optional description (description might contain spaces)
-                 parts = line.split(maxsplit=2)
-                 if len(parts) >= 2:
-                     serial = parts[0]
-                     state = parts[1]
-                     description = parts[2] if len(parts) > 2 else ""
-
-                     # Include 'device', 'unauthorized', and 'offline' states.
-                     # GUI can filter or display state appropriately.
-                     # An offline device might become online, Unauthorized needs user action.
-                     devices.append({
-                         'serial': serial,
-                         'state': state,
-                         'description': description # Includes model/product info from -l
-                     })
-                 else:
-                      # Handle unexpected line formats (e.g., just serial or state missing)
-                      self._update_status(f"Warning: Could not fully parse device line: '{line}'", level="warning")
+            # One pass over the whole output: each match is "serial state [description]".
+            # The "List of devices attached" header and daemon messages ("* daemon started ...")
+            # also fit the pattern and are skipped.
+            # Include 'device', 'unauthorized', and 'offline' states.
+            # GUI can filter or display state appropriately.
+            # An offline device might become online, Unauthorized needs user action.
+            devices = [
+                {'serial': m[1], 'state': m[2], 'description': m[3] or ''} # Description includes model/product info from -l
+                for m in _DEVICE_LINE_RE.finditer(stdout)
+                if m[1] not in ('List', '*')
+            ]
 
             if devices:
                  # Status already updated by _run_adb_command for success/warning
@@ -199,8 +678,214 @@ class AdbManager:
                 self._update_status("No devices found.", level="info") # Handles case where stdout is empty but returncode is 0
             # else: _run_adb_command handled error status
 
+        # Only a successful listing is cached; after an error adb is asked again next time
+        if returncode == 0:
+            self._apply_device_list(devices)
+
         return devices
 
+
+    def _apply_device_list(self, devices):
+        """Caches a fresh device list and drops the per-device state of devices that are gone or not ready."""
+        self._devices_cache = {device['serial']: device['state'] for device in devices}
+        self._devices_cache_ts = time.monotonic()
+        # A device that went away may come back as a different build (e.g. after flashing)
+        for serial in list(self._ro_cache):
+            if self._devices_cache.get(serial) != 'device':
+                self.invalidate_device_info(serial)
+        # Shells of devices that went away are dead or soon will be. They are only terminated here,
+        # without taking the shell lock: this runs on the tracking thread, which must not wait behind
+        # a long command on that device. A command still running sees the shell exit and fails;
+        # the next command finds the shell dead and starts a new one (see _get_shell).
+        for serial, session in list(self._shell_procs.items()):
+            if self._devices_cache.get(serial) != 'device':
+                try:
+                    session[0].terminate()
+                except Exception:
+                    pass
+
+
+    def start_device_tracking(self, callback):
+        """
+        Follows device changes pushed by the adb server instead of polling 'adb devices'.
+        A connection to the server's 'host:track-devices' service stays open; the server sends the full
+        device list once at the start and again on every change. While tracking, list_devices()
+        returns the last pushed list without spawning adb.
+        The server is reached with a socket when its address is known (ANDROID_ADB_SERVER_PORT /
+        ADB_SERVER_SOCKET with a TCP address), otherwise through an 'adb track-devices' process.
+        Blocks briefly (and may start the adb server), so call it from a worker thread.
+
+        Args:
+            callback: Called from the tracking thread with the device list (dicts as returned by
+                      list_devices(), with an empty 'description') each time the server pushes one.
+
+        Returns:
+            True if tracking is running, False otherwise (list_devices() then keeps asking adb).
+        """
+        if not self.adb_available: return False
+        if self._track_source is not None: return True
+
+        endpoint = self._adb_server_endpoint()
+        if endpoint is not None:
+            source = self._open_track_socket(endpoint)
+        else:
+            source = self._open_track_process()
+        if source is None:
+            self._update_status("Could not follow device changes from the adb server; use Refresh to update the list.", level="warning")
+            return False
+        self._track_source = source
+        threading.Thread(target=self._track_devices_worker, args=(source, callback), daemon=True).start()
+        return True
+
+
+    @staticmethod
+    def _adb_server_endpoint():
+        """
+        Works out the adb server's TCP address the way the adb client does.
+
+        Returns:
+            (host, port), or None if the environment names an address this class cannot reach with a
+            plain TCP socket (a Unix socket, or a value it cannot parse) and the adb client should be used.
+        """
+        host = os.environ.get('ANDROID_ADB_SERVER_ADDRESS') or '127.0.0.1'
+        port = os.environ.get('ANDROID_ADB_SERVER_PORT') or '5037'
+        server_socket = os.environ.get('ADB_SERVER_SOCKET')
+        if server_socket:
+            # "tcp:<port>" or "tcp:<host>:<port>"; anything else (localfilesystem:, ...) is left to adb
+            if not server_socket.startswith('tcp:'):
+                return None
+            host_part, _, port = server_socket[len('tcp:'):].rpartition(':')
+            host = host_part.strip('[]') or host
+        try:
+            port = int(port)
+        except ValueError:
+            return None
+        if not 0 < port < 65536:
+            return None
+        return host, port
+
+
+    def _open_track_socket(self, endpoint):
+        """Connects to the adb server at endpoint and requests 'host:track-devices'. Returns the socket, or None on failure."""
+        request = b'host:track-devices'
+        for attempt in range(2):
+            try:
+                sock = socket.create_connection(endpoint, timeout=2)
+            except OSError:
+                if attempt:
+                    break
+                # No server yet: start one (as any adb command would) and try again
+                self._run_adb_command([self._adb_path, 'start-server'], timeout=20)
+                continue
+            try:
+                # Requests are framed as 4 hex digits of length followed by the payload
+                sock.sendall(b'%04x' % len(request) + request)
+                if self._recv_exact(sock, 4) == b'OKAY':
+                    sock.settimeout(None) # From now on the reader waits for pushes indefinitely
+                    return sock
+            except OSError:
+                pass
+            sock.close()
+            break
+        return None
+
+
+    def _open_track_process(self):
+        """Starts 'adb track-devices', which relays the server's pushes (same framing) on stdout. Returns the process, or None on failure."""
+        try:
+            return subprocess.Popen([self._adb_path, 'track-devices'], stdin=subprocess.DEVNULL,
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, **self._popen_kwargs)
+        except OSError:
+            return None
+
+
+    @staticmethod
+    def _recv_exact(sock, size):
+        """Reads exactly size bytes from sock. Returns None if the connection closed first."""
+        data = bytearray()
+        while len(data) < size:
+            chunk = sock.recv(size - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return bytes(data)
+
+
+    @staticmethod
+    def _read_exact(pipe, size):
+        """Reads exactly size bytes from a binary pipe. Returns None if it closed first."""
+        data = pipe.read(size) # Buffered read: blocks until size bytes or EOF
+        return data if len(data) == size else None
+
+
+    def _track_devices_worker(self, source, callback):
+        """Reads device lists pushed by the adb server (4 hex digits of length, then 'serial<TAB>state' lines)."""
+        if isinstance(source, socket.socket):
+            read_exact = functools.partial(self._recv_exact, source)
+        else:
+            read_exact = functools.partial(self._read_exact, source.stdout)
+        received = False
+        try:
+            while True:
+                header = read_exact(4)
+                if header is None:
+                    break
+                payload = read_exact(int(header, 16)) if header != b'0000' else b''
+                if payload is None:
+                    break
+                received = True
+                devices = [
+                    {'serial': m[1], 'state': m[2], 'description': m[3] or ''}
+                    for m in _DEVICE_LINE_RE.finditer(payload.decode('utf-8', errors='replace'))
+                ]
+                self._apply_device_list(devices)
+                self._tracked_devices = devices
+                try:
+                    callback([dict(device) for device in devices])
+                except Exception as e:
+                    self._update_status(f"Error in device tracking callback: {e}", level="error")
+        except (OSError, ValueError):
+            pass # Connection closed by stop_device_tracking() or by the server going away
+        finally:
+            # Back to polling: list_devices() asks adb again
+            self._tracked_devices = None
+            if self._track_source is source:
+                self._track_source = None
+                if not received:
+                    # 'adb track-devices' gave up right away (e.g. no server could be reached)
+                    self._update_status("Could not follow device changes from the adb server; use Refresh to update the list.", level="warning")
+            self._close_track_source(source)
+
+
+    @staticmethod
+    def _close_track_source(source):
+        """Closes a tracking socket, or ends and reaps an 'adb track-devices' process."""
+        if isinstance(source, socket.socket):
+            source.close()
+            return
+        try:
+            source.kill()
+            source.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        if source.stdout:
+            source.stdout.close()
+
+
+    def stop_device_tracking(self):
+        """Closes the 'host:track-devices' connection, if any; list_devices() goes back to asking adb."""
+        source, self._track_source = self._track_source, None
+        self._tracked_devices = None
+        if source is None:
+            return
+        try:
+            if isinstance(source, socket.socket):
+                source.shutdown(socket.SHUT_RDWR) # Wakes up the reader blocked in recv()
+            else:
+                source.terminate() # Its stdout reaches EOF, which ends the reader
+        except OSError:
+            pass
+
     def connect_device(self, address):
         """
         Connects to a device via TCP/IP address.
@@ -209,44 +894,120 @@ class AdbManager:
             address: The IP address and optional port (e.g., "192.168.1.10:5555").
 
         Returns:
-            True if the connect command likely succeeded (return code 0 and expected output), False otherwise.
+            (serial, state) if the connect command likely succeeded (return code 0 and expected output):
+            serial is the one adb registered the device under (e.g. with the default port added), state
+            the last one seen while waiting for the device ("device" once ready) or None.
+            (None, None) otherwise.
         """
         if not self.adb_available:
-            return False
+            return None, None
 
         if not address:
             self._update_status("Error: IP address is empty for connection.", level="error")
-            return False
+            return None, None
 
         self._update_status(f"Attempting to connect to {address}...", level="info")
-        command = ['adb', 'connect', address]
+        # A new device may appear, so the cached list can no longer reject serials
+        self.invalidate_devices_cache()
+        command = [self._adb_path, 'connect', address]
         stdout, stderr, returncode = self._run_adb_command(command, timeout=15)
 
         if returncode == 0:
             # ADB connect command successful, check stdout for confirmation messages
             stdout_lower = stdout.lower()
+            if "failed to authenticate" in stdout_lower:
+                 # Connected, but the device has not accepted this computer's key yet: waiting would not help
+                 self._update_status(f"Connected to {address}, but the device is unauthorized. Accept the debugging prompt on the device.", level="warning")
+                 return address, 'unauthorized'
             if "connected to" in stdout_lower or "already connected" in stdout_lower:
                  # AdbManager status updated by _run_adb_command on success
-                 return True
+                 # Wait (briefly) until the device is ready so the first commands sent to it do not stall.
+                 # adb reports the full serial (address with the default port added if it was omitted).
+                 serial_match = _CONNECTED_TO_RE.search(stdout)
+                 serial = serial_match.group(1) if serial_match else address
+                 self.invalidate_device_info(serial)
+                 state = self._poll_device_state(serial, timeout=self.CONNECT_READY_TIMEOUT)
+                 if state == 'unauthorized':
+                     self._update_status(f"Connected to {serial}, but the device is unauthorized. Accept the debugging prompt on the device.", level="warning")
+                 elif state != 'device':
+                     self._update_status(f"Connected to {serial}, but it is not ready yet (state: {state or 'unknown'}).", level="warning")
+                 return serial, state
             elif " connection refused" in stdout_lower:
                  self._update_status(f"Connection failed for {address}: Connection refused. Is ADB over TCP enabled on the device?", level="error")
-                 return False
+                 return None, None
             elif " unable to connect" in stdout_lower or "failed to connect" in stdout_lower:
                  # AdbManager status updated by _run_adb_command on error (via stderr check)
                  # Fallback check on stdout just in case stderr is empty
                  self._update_status(f"Connection failed for {address}: {stdout.strip()}", level="error")
-                 return False
+                 return None, None
             else:
                  # Unexpected successful output, but treat as success based on return code 0
+                 # (the serial is unknown, so the address is the best guess)
                  self._update_status(f"Connect command successful for {address}, but output was unexpected: {stdout.strip()}", level="warning")
-                 return True
+                 return address, None
         else:
              # Non-zero return code errors (already reported by _run_adb_command)
-             return False
+             return None, None
+
+    def _poll_device_state(self, serial, timeout):
+        """
+        Polls 'adb get-state' until the device is ready, is found unauthorized, or the timeout runs out.
+        Quiet: failed polls are expected while the device comes up and are not reported.
+
+        Args:
+            serial: The serial number or IP:port of the target device.
+            timeout: Maximum time in seconds to poll.
+
+        Returns:
+            "device" or "unauthorized" as soon as seen, otherwise the last state seen ("offline", ...) or None.
+        """
+        deadline = time.monotonic() + timeout
+        state = None
+        while True:
+            try:
+                result = subprocess.run(self._device_command(serial, 'get-state'), capture_output=True,
+                                        timeout=max(deadline - time.monotonic(), 0.5), check=False, **self._popen_kwargs)
+                if result.returncode == 0:
+                    state = result.stdout.decode('utf-8', errors='replace').strip() or state
+                else:
+                    # A not-ready device makes get-state fail with e.g. "error: device unauthorized" / "device offline"
+                    error_output = result.stderr.decode('utf-8', errors='replace').lower()
+                    for candidate in ('unauthorized', 'offline'):
+                        if candidate in error_output:
+                            state = candidate
+                            break
+            except Exception:
+                pass
+            if state in ('device', 'unauthorized') or time.monotonic() >= deadline:
+                return state
+            time.sleep(0.25)
+
+
+    def get_state(self, serial):
+        """
+        Queries the state of a single device with 'adb get-state', without listing all devices.
+
+        Args:
+            serial: The serial number or IP:port of the target device.
+
+        Returns:
+            The state string (e.g., "device", "offline", "unauthorized"), or None if the device was not found.
+        """
+        if not self.adb_available: return None
+        if not serial: return None
+
+        stdout, stderr, returncode = self._run_adb_command(self._device_command(serial, 'get-state'), timeout=5)
+        if returncode != 0 or not stdout:
+            return None # _run_adb_command handles error status
+        return stdout.strip() or None
 
     def get_device_info(self, serial):
         """
-        Gets basic information for a specific device by running separate getprop/dumpsys commands.
+        Gets basic information for a specific device.
+        All properties and the battery status are fetched with a single 'adb shell' invocation
+        ('getprop' dump followed by 'dumpsys battery') and parsed locally.
+        The static properties are cached per device, so later calls only query the battery
+        until the device is reconnected, rebooted or disappears from list_devices().
         Attempts to find a user-friendly display name and battery level.
 
         Args:
@@ -261,152 +1022,148 @@ class AdbManager:
         if not serial:
              self._update_status("Error: No device selected to get info.", level="error")
              return None
+        if not self._is_serial_known(serial): return None
 
         self._update_status(f"Fetching info for device {serial}...", level="info")
 
         # Initialize info dictionary with defaults
-        info = {
-            'serial': serial,
-            'model': 'N/A',
-            'version': 'N/A',
-            'display_name': 'N/A', # The name we'll try to use for display
-            'battery_level': 'N/A' # Battery percentage
-        }
-
-        # List of properties to try fetching for a display name, in order of preference
-        # Based on common properties and user's getprop output analysis.
-        prop_names_to_try = [
-            'ro.product.marketname',      # Found in user's output - High priority!
-            'ro.product.vendor.marketname', # Found in user's output
-            'ro.product.odm.marketname',  # Found in user's output
-            'ro.product.system_dlkm.marketname', # Found in user's output
-            'ro.product.bootimage.marketname', # Found in user's output
-            'ro.product.display',         # Less common but might exist
-            'ro.product.name',
-            'ro.product.device',
-            'ro.product.model',           # Always available, good fallback
-            'ro.vendor.product.model',
-            'ro.system.product.model',
-            'ro.system_ext.product.model',
-            'ro.odm.product.model',
-            # Add other potential properties if known for specific devices
-        ]
-
-        fetched_values = {}
-        essential_info_fetched = {'model': False, 'version': False, 'battery': False} # Track essential fetches
-
-
-        # --- Fetch essential properties first ---
-        # Get Model
-        model_command = ['adb', '-s', serial, 'shell', 'getprop', 'ro.product.model']
-        stdout_model, stderr_model, returncode_model = self._run_adb_command(model_command, timeout=5)
-        if returncode_model == 0 and stdout_model:
-             model_value = stdout_model.strip().strip("'\"\r")
-             if model_value:
-                 info['model'] = model_value
-                 fetched_values['ro.product.model'] = info['model'] # Store in fetched_values too
-                 essential_info_fetched['model'] = True
-                 # print(f"DEBUG: Fetched ro.product.model: '{info['model']}'") # DEBUG PRINT
-             # else: _run_adb_command handles warning for empty stdout on success
-        # else: _run_adb_command handles error status
-
-
-        # Get Android Version
-        version_command = ['adb', '-s', serial, 'shell', 'getprop', 'ro.build.version.release']
-        stdout_version, stderr_version, returncode_version = self._run_adb_command(version_command, timeout=5)
-        if returncode_version == 0 and stdout_version:
-             version_value = stdout_version.strip().strip("'\"\r")
-             if version_value:
-                 info['version'] = version_value
-                 essential_info_fetched['version'] = True
-                 # print(f"DEBUG: Fetched ro.build.version.release: '{info['version']}'") # DEBUG PRINT
-             # else: _run_adb_command handles warning for empty stdout on success
-        # else: _run_adb_command handles error status
-
-
-        # Get Battery Level
-        battery_command = ['adb', '-s', serial, 'shell', 'dumpsys', 'battery']
-        stdout_battery, stderr_battery, returncode_battery = self._run_adb_command(battery_command, timeout=5)
-        if returncode_battery == 0 and stdout_battery:
-            # Parse battery output to find the level
-            # Output often contains a line like "level: 85"
-            for line in stdout_battery.splitlines():
-                line = line.strip()
-                if line.startswith('level:'):
-                    try:
-                        level_str = line.split(':')[1].strip()
-                        info['battery_level'] = f"{level_str}%"
-                        essential_info_fetched['battery'] = True
-                        # print(f"DEBUG: Fetched battery level: '{info['battery_level']}'") # DEBUG PRINT
-                        break # Found the level, no need to check other lines
-                    except (IndexError, ValueError) as e:
-                        self._update_status(f"Warning: Could not parse battery level line: '{line}'", level="warning")
-                        # print(f"DEBUG: Battery parsing error: {e}") # DEBUG PRINT
+        info = _INFO_TEMPLATE.copy()
+        info['serial'] = serial
+
+        static_info = self._ro_cache.get(serial)
+        if static_info is None:
+            # --- Fetch everything in one round-trip ---
+            # 'getprop' without arguments dumps all properties as "[name]: [value]" lines.
+            # Both commands are written to the device's shell at once and their outputs are
+            # split apart by the shell sentinels. The output is kept as bytes and only the values we use are decoded.
+            results = self._run_shell_batch(serial, ['getprop', 'dumpsys battery'], timeout=5)
+            if not results or results[0][1] != 0 or not results[0][0]:
+                 # _run_shell_batch handles shell failure status
+                 self._update_status(f"Failed to fetch essential model/version info for device {serial}.", level="error")
+                 return None
+
+            (props_output, _), (battery_output, _) = results
+            static_info = self._parse_static_info(serial, props_output)
+            if static_info is None:
+                 self._update_status(f"Failed to fetch essential model/version info for device {serial}.", level="error")
+                 return None # Indicate total failure
+            self._ro_cache[serial] = static_info
+        else:
+            # Model, version and names never change while the device stays connected,
+            # so a refresh only needs the battery status.
+            battery_output, _, _ = self._run_shell(serial, 'dumpsys battery', timeout=5, raw=True)
+            if battery_output is None:
+                 return None # _run_shell handles shell failure status
 
-        # else: _run_adb_command handles error status
+        info.update(static_info)
 
 
-        # --- Fetch other potential name/model properties in preference order ---
-        best_display_name_found = None
+        # --- Battery Level ---
+        # Output contains a line like "  level: 85"
+        battery_match = _BATTERY_LEVEL_RE.search(battery_output)
+        if battery_match:
+            info['battery_level'] = f"{int(battery_match.group(1))}%"
+
+
+        self._update_status(f"Info fetch complete for {serial}.", level="info")
+        return info
+
+
+    def _parse_static_info(self, serial, props_output):
+        """
+        Extracts the properties that do not change while a device is connected from a 'getprop' dump.
+
+        Args:
+            serial: The device serial (used as the last-resort display name).
+            props_output: The raw 'getprop' output (bytes).
+
+        Returns:
+            A dictionary with 'model', 'version' and 'display_name',
+            or None if neither model nor version could be found.
+        """
+        info = {'model': 'N/A', 'version': 'N/A', 'display_name': 'N/A'}
+
+        props = {}
+        for match in _PROP_RE.finditer(props_output):
+             value = match.group(2).decode('utf-8', errors='replace').strip().strip("'\"\r")
+             if value: # Only store non-empty values
+                 props[match.group(1).decode('utf-8', errors='replace')] = value
+
+
+        # --- Essential properties ---
+        if 'ro.product.model' in props:
+             info['model'] = props['ro.product.model']
 
-        for prop_name in prop_names_to_try:
-            # Skip properties we already explicitly fetched
-            if prop_name in ['ro.product.model', 'ro.build.version.release']:
-                 continue
-
-            command = ['adb', '-s', serial, 'shell', 'getprop', prop_name]
-            stdout, stderr, returncode = self._run_adb_command(command, timeout=5)
-            if returncode == 0 and stdout:
-                 value = stdout.strip().strip("'\"\r")
-                 # print(f"DEBUG: Fetched {prop_name}: '{value}'") # DEBUG PRINT
-                 if value: # Only store non-empty values
-                     fetched_values[prop_name] = value
-
-                     # Check if this value is a good candidate for display_name
-                     # Prioritize based on the order in prop_names_to_try
-                     # Only set if we haven't found a better one yet
-                     if best_display_name_found is None:
-                         if 'ro.product.model' in fetched_values and value == fetched_values['ro.product.model']:
-                              # If same as model, only prioritize if it's a marketname property
-                              if 'marketname' in prop_name.lower():
-                                   best_display_name_found = value
-                                #    print(f"DEBUG: Setting potential best_display_name_found (marketname): '{value}' from {prop_name}") # DEBUG PRINT
-                             # else: skip, it's just the model again
-                         else:
-                              # Value is different from model or model wasn't fetched yet, use it
-                              best_display_name_found = value
-                            #   print(f"DEBUG: Setting potential best_display_name_found: '{value}' from {prop_name}") # DEBUG PRINT
-
-
-            # _run_adb_command handles error status for individual fetches if returncode != 0 or stderr
-            # We don't increment errors_during_fetch_count for these non-essential properties
+        if 'ro.build.version.release' in props:
+             info['version'] = props['ro.build.version.release']
+
+
+        # --- Pick the first suitable name/model property in preference order ---
+        # A value that is just the model again is only taken from a marketname property;
+        # ro.product.model itself is skipped here and used as the fallback below.
+        model = props.get('ro.product.model')
+        best_display_name_found = None
+        for prop_name in _DISPLAY_NAME_PROPS:
+            value = props.get(prop_name)
+            if value and (value != model or 'marketname' in prop_name):
+                 best_display_name_found = value
+                 break
 
 
         # --- Finalize display_name ---
         if best_display_name_found and best_display_name_found not in ['N/A', 'Error', '']:
             info['display_name'] = best_display_name_found
-            # print(f"DEBUG: Final display_name set from best candidate: '{info['display_name']}'") # DEBUG PRINT
         # Fallback: If no suitable display_name found, use the fetched model
         elif info['model'] not in ['N/A', 'Error']:
              info['display_name'] = info['model'] # Fallback to model
-            #  print(f"DEBUG: Final display_name set from ro.product.model (fallback): '{info['display_name']}') # DEBUG PRINT
         # Fallback: If model also failed, use the serial
         else:
              info['display_name'] = serial # Fallback to serial
-            #  print(f"DEBUG: Final display_name set from serial (fallback): '{info['display_name']}') # DEBUG PRINT
 
 
         # --- Check if essential info failed ---
         # Consider a significant failure if we couldn't get at least model OR version
-        # We check the flags set earlier. Battery is not considered essential for overall device identification.
-        if not essential_info_fetched['model'] and not essential_info_fetched['version']:
-             self._update_status(f"Failed to fetch essential model/version info for device {serial}.", level="error")
-             return None # Indicate total failure
-        else:
-             # At least one essential piece of info was fetched.
-             self._update_status(f"Info fetch complete for {serial}.", level="info")
-             # print(f"DEBUG: Final info dictionary for {serial}: {info}") # DEBUG PRINT
-             return info # Return the dictionary
+        # Both still hold their defaults if they were not found. Battery is not considered essential for overall device identification.
+        if info['model'] == 'N/A' and info['version'] == 'N/A':
+             return None
+        return info
+
+
+    def invalidate_device_info(self, serial):
+        """Forgets the cached static properties of a device (after reconnecting, rebooting or disconnecting)."""
+        self._ro_cache.pop(serial, None)
+
+
+    def bulk(self, serials, method_name, *args):
+        """
+        Runs the same per-device method for several devices concurrently on the worker pool.
+        Commands for the same device are still serialized by its shell lock,
+        so each device sees at most one command at a time.
+
+        Args:
+            serials: An iterable of serial numbers or IP:port addresses.
+            method_name: Name of an AdbManager method taking the serial as its first argument
+                         (e.g., "get_device_info", "list_packages").
+            *args: Further arguments passed to every call after the serial.
+
+        Returns:
+            A list with each call's result, in the same order as serials.
+        """
+        method = getattr(self, method_name)
+        return list(self._pool.map(lambda serial: method(serial, *args), serials))
+
+
+    def get_device_info_batch(self, serials):
+        """
+        Gets device info for several devices concurrently (see bulk()).
+
+        Args:
+            serials: An iterable of serial numbers or IP:port addresses.
+
+        Returns:
+            A list of info dictionaries (or None for failed devices), in the same order as serials.
+        """
+        return self.bulk(serials, 'get_device_info')
 
 
     # Add other ADB command methods here:
@@ -426,17 +1183,17 @@ class AdbManager:
         if not serial:
              self._update_status("Error: No device selected to reboot.", level="error")
              return False
+        if not self._is_serial_known(serial): return False
 
-        valid_modes = ["", "recovery", "bootloader", "sideload", "sideload-auto-reboot"]
-        if mode not in valid_modes:
-            self._update_status(f"Error: Invalid reboot mode '{mode}'. Valid modes are: {', '.join(valid_modes)}.", level="error")
+        if mode not in _REBOOT_MODES:
+            self._update_status(f"Error: Invalid reboot mode '{mode}'. Valid modes are: {', '.join(_REBOOT_MODES)}.", level="error")
             return False
 
-        command = ['adb', '-s', serial, 'reboot']
         if mode:
-            command.append(mode)
+            command = self._device_command(serial, 'reboot', mode)
             self._update_status(f"Sending command: Rebooting device {serial} to {mode}...", level="info")
         else:
+             command = self._device_command(serial, 'reboot')
              self._update_status(f"Sending command: Rebooting device {serial} normally...", level="info")
 
         # Reboot commands typically don't have useful stdout/stderr on success,
@@ -446,6 +1203,8 @@ class AdbManager:
 
         # If _run_adb_command reported an error (returncode != 0 or stderr/exception), status is updated there.
         # If returncode == 0 and no stderr, assume command was sent successfully.
+        # Properties may change across a reboot (e.g. after an OTA update)
+        self.invalidate_device_info(serial)
         if returncode == 0 and not stderr.strip():
             self._update_status(f"Reboot command sent successfully to {serial}.", level="info")
             return True
@@ -468,10 +1227,11 @@ class AdbManager:
         if not serial:
              self._update_status("Error: No device selected to power off.", level="error")
              return False
+        if not self._is_serial_known(serial): return False
 
         self._update_status(f"Sending command: Powering off device {serial}...", level="info")
         # 'reboot -p' is the most common and reliable way to power off via shell
-        command = ['adb', '-s', serial, 'shell', 'reboot', '-p']
+        command = self._device_command(serial, 'shell', 'reboot', '-p')
         stdout, stderr, returncode = self._run_adb_command(command, timeout=10)
 
         # Similar to reboot, power off might not give a clean success indication
@@ -500,18 +1260,17 @@ class AdbManager:
         if not serial or not apk_path:
              self._update_status("Error: Device and APK path must be specified for installation.", level="error")
              return False
-
-        if not os.path.exists(apk_path):
-            self._update_status(f"Error: APK file not found at {apk_path}", level="error")
-            return False
+        if not self._is_serial_known(serial): return False
 
         self._update_status(f"Sending command: Installing {os.path.basename(apk_path)} on {serial}...", level="info")
 
         # Basic install command. Could be extended with -r (reinstall) or -g (grant permissions)
-        command = ['adb', '-s', serial, 'install', '-r', apk_path]
+        command = self._device_command(serial, 'install', '-r', apk_path)
 
         # Installation can take a significant amount of time for large APKs
         stdout, stderr, returncode = self._run_adb_command(command, timeout=300)
+        # The package name is not known here, so forget all cached details of the device
+        self.invalidate_package_cache(serial)
 
         if returncode == 0 and "success" in stdout.lower():
             self._update_status(f"Successfully installed {os.path.basename(apk_path)}.", level="info")
@@ -520,55 +1279,81 @@ class AdbManager:
             # _run_adb_command updates status for command errors/stderr
             if returncode == 0 and "failure" in stdout.lower():
                 self._update_status(f"Installation reported failure: {stdout.strip()}", level="error")
+            # The file is not checked up front (adb stats it anyway), so a missing APK shows up
+            # here as "adb: failed to stat <path>: No such file or directory".
+            elif returncode != 0 and "no such file or directory" in f"{stdout}{stderr}".lower():
+                self._update_status(f"Error: APK file not found at {apk_path}", level="error")
             return False
 
 
-    def list_packages(self, serial, user_only=True):
+    def list_packages_iter(self, serial, user_only=True):
         """
-        Lists installed packages on the specified device for user 0.
+        Lists installed packages on the specified device for user 0, yielding each package name
+        as soon as its line arrives from the device. Closing the generator early cancels the listing.
 
         Args:
             serial: The serial number or IP:port of the target device.
             user_only: If True, list only non-system (3rd party) packages.
 
-        Returns:
-            A list of package names (strings), or an empty list if error or no packages found.
+        Yields:
+            Package names (strings). Nothing is yielded on error or if no packages are found.
         """
-        if not self.adb_available: return []
+        if not self.adb_available: return
         if not serial:
              self._update_status("Error: No device selected to list packages.", level="warning")
-             return []
+             return
+        if not self._is_serial_known(serial): return
 
         user_id = '0' # Always target the primary user
 
         self._update_status(f"Listing packages for device {serial} (User {user_id}, {'User apps only' if user_only else 'All apps'})...", level="info")
 
-        command = ['adb', '-s', serial, 'shell', 'pm', 'list', 'packages', '--user', user_id]
+        cmdline = f'pm list packages --user {user_id}'
         if user_only:
-            command.append('-3') # Filter for third-party apps
+            cmdline += ' -3' # Filter for third-party apps
 
         # Using a longer timeout as listing packages can take time on some devices
-        stdout, stderr, returncode = self._run_adb_command(command, timeout=60)
-
-        packages = []
-        if returncode == 0 and stdout:
-            # Output is typically like "package:com.example.app\r\n"
-            for line in stdout.strip().split('\n'):
-                line = line.strip()
-                if line.startswith('package:'):
-                    # Extract the package name after "package:"
-                    package_name = line[len('package:'):].strip()
-                    if package_name:
-                        packages.append(package_name)
-
-            self._update_status(f"Found {len(packages)} packages.", level="info")
-        # _run_adb_command handles status for non-zero returncode or stderr
-        elif returncode == 0 and not stdout.strip():
-             # Return code 0 but empty stdout might mean no packages found with the filter
+        shell_lines = self._iter_shell(serial, cmdline, timeout=60)
+        package_count = 0
+        while True:
+            try:
+                line = next(shell_lines)
+            except StopIteration as stop:
+                returncode, error_message = stop.value
+                break
+            # Output is typically like "package:com.example.app"
+            # Lines are checked as bytes, only package names are decoded
+            if line.startswith(b'package:'):
+                # Extract the package name after "package:"
+                package_name = line[8:].strip()
+                if package_name:
+                    package_count += 1
+                    yield package_name.decode('utf-8', errors='replace')
+
+        if error_message is not None:
+             return # _iter_shell handles status when the shell fails
+        if returncode != 0:
+             self._update_status(f"ADB Command Error: Listing packages failed with return code {returncode}.", level="error")
+        elif package_count:
+             self._update_status(f"Found {package_count} packages.", level="info")
+        else:
+             # Return code 0 but no package lines might mean no packages found with the filter
              self._update_status("No packages found with the current filter.", level="info")
-        # else: error status handled by _run_adb_command
 
-        return packages
+
+    def list_packages(self, serial, user_only=True):
+        """
+        Lists installed packages on the specified device for user 0.
+
+        Args:
+            serial: The serial number or IP:port of the target device.
+            user_only: If True, list only non-system (3rd party) packages.
+
+        Returns:
+            A frozenset of package names (strings) for fast membership tests,
+            or an empty frozenset if error or no packages found. Use sorted() for display order.
+        """
+        return frozenset(self.list_packages_iter(serial, user_only))
 
 
     def uninstall_package(self, serial, package_name, user_id='0'):
@@ -587,14 +1372,16 @@ class AdbManager:
         if not serial or not package_name:
              self._update_status("Error: Device and package must be specified for uninstall.", level="error")
              return False
+        if not self._is_serial_known(serial): return False
 
         self._update_status(f"Sending command: Uninstalling {package_name} from {serial} (User {user_id})...", level="info")
 
         # Use --user flag for the specific user
         # --k flag is NOT used here as per requirement to fully uninstall if possible
-        command = ['adb', '-s', serial, 'uninstall', '--user', user_id, package_name]
+        command = self._device_command(serial, 'uninstall', '--user', user_id, package_name)
 
         stdout, stderr, returncode = self._run_adb_command(command, timeout=60) # Uninstall can take time
+        self.invalidate_package_cache(serial, package_name)
 
         if returncode == 0 and "success" in stdout.lower():
             self._update_status(f"Successfully uninstalled {package_name}.", level="info")
@@ -625,23 +1412,24 @@ class AdbManager:
         if not serial or not package_name:
              self._update_status("Error: Device and package must be specified for disabling.", level="error")
              return False
+        if not self._is_serial_known(serial): return False
 
         self._update_status(f"Sending command: Disabling {package_name} for {serial} (User {user_id})...", level="info")
 
         # Use --user flag for the specific user
-        command = ['adb', '-s', serial, 'shell', 'pm', 'disable-user', '--user', user_id, package_name]
+        cmdline = f"pm disable-user --user {user_id} {package_name}"
 
-        stdout, stderr, returncode = self._run_adb_command(command, timeout=30) # Disable is usually faster
+        stdout, stderr, returncode = self._run_shell(serial, cmdline, timeout=30) # Disable is usually faster
+        self.invalidate_package_cache(serial, package_name)
 
         if returncode == 0:
             # The output for successful disable is often just the new package state, e.g.,
             # "Package com.example.app new state: disabled\r\n"
-            # We check for the package name followed by "new state: disabled"
-            if f"package {package_name} new state: disabled" in stdout.lower():
+            # We check for the package name followed by "new state: disabled" (case-insensitive, without copying stdout)
+            if _disabled_state_re(package_name).search(stdout):
                 self._update_status(f"Successfully disabled {package_name}.", level="info")
                 return True
             # Else, if returncode is 0 but output doesn't confirm disable, maybe a partial success?
-            # Or _run_adb_command might have reported a warning via stderr
             elif stdout.strip():
                 self._update_status(f"Disable command sent for {package_name}, but output was unexpected: {stdout.strip()}", level="warning")
                 return True # Assume success if returncode is 0 and some stdout
@@ -651,150 +1439,415 @@ class AdbManager:
                  return False
 
         else:
-            # _run_adb_command updates status for command errors/stderr
+            # _run_shell updates status for command errors
             return False
 
 
-    def get_package_details(self, serial, package_name):
+    def remove_package(self, serial, package_name, user_id='0'):
+        """
+        Uninstalls a package for a user, or disables it if it cannot be uninstalled (e.g. system apps).
+        Both steps run as one shell script on the device, so the fallback costs no extra round-trip.
+
+        Args:
+            serial: The serial number or IP:port of the target device.
+            package_name: The package name to remove.
+            user_id: The user ID to remove it for (default '0').
+
+        Returns:
+            "success" if uninstalled, "disabled" if disabled instead, or "failed".
+        """
+        if not package_name:
+             self._update_status("Error: Device and package must be specified for uninstall.", level="error")
+             return "failed"
+        # The generator is run to the end, so the shell output is fully consumed
+        results = list(self.remove_packages_iter(serial, [package_name], user_id))
+        return results[0][1] if results else "failed"
+
+
+    def remove_packages_iter(self, serial, package_names, user_id='0'):
+        """
+        Removes several packages with a single shell script: each one is uninstalled, or disabled
+        if it cannot be uninstalled (e.g. system apps). Results are yielded as the device reports
+        them, so callers can show progress while the script is still running.
+
+        Args:
+            serial: The serial number or IP:port of the target device.
+            package_names: The package names to remove, in order.
+            user_id: The user ID to remove them for (default '0').
+
+        Yields:
+            (package_name, result) tuples in the order of package_names, where result is
+            "success" if uninstalled, "disabled" if disabled instead, or "failed".
+        """
+        package_names = list(package_names)
+        if not package_names: return
+        if not self.adb_available or not serial or not self._is_serial_known(serial):
+            if self.adb_available and not serial:
+                self._update_status("Error: Device and package must be specified for uninstall.", level="error")
+            for package_name in package_names:
+                yield package_name, "failed"
+            return
+
+        self._update_status(f"Sending command: Uninstalling {len(package_names)} package(s) from {serial} (User {user_id})...", level="info")
+
+        # 'pm uninstall' reports failure in its output rather than reliably in its exit code,
+        # so the script checks the output and only then falls back to disabling.
+        # Per package: the uninstall output, then (on fallback) __DISABLE__, the disable output and
+        # its exit code, then __END__ once the package is done.
+        script = "; ".join(
+            f"r=$(pm uninstall --user {user_id} {package_name} 2>&1); echo \"$r\"; "
+            f"case \"$r\" in *Success*) ;; *) echo __DISABLE__; pm disable-user --user {user_id} {package_name}; echo \"__RC__ $?\";; esac; "
+            f"echo __END__"
+            for package_name in package_names
+        )
+
+        # Uninstall can take time, per package
+        shell_lines = self._iter_shell(serial, script, timeout=60 * len(package_names))
+        done = 0
+        uninstall_output, disable_output, disabling, disable_rc = [], [], False, 1
+        try:
+            for line in shell_lines:
+                if done >= len(package_names):
+                    continue # Nothing is expected after the last package
+                if line == b'__END__':
+                    package_name = package_names[done]
+                    done += 1
+                    self.invalidate_package_cache(serial, package_name)
+                    yield package_name, self._removal_result(
+                        package_name, b'\n'.join(uninstall_output), disabling, b'\n'.join(disable_output), disable_rc)
+                    uninstall_output, disable_output, disabling, disable_rc = [], [], False, 1
+                elif line == b'__DISABLE__':
+                    disabling = True
+                elif disabling and line.startswith(b'__RC__ '):
+                    disable_rc = int(line[7:]) if line[7:].isdigit() else 1
+                elif disabling:
+                    disable_output.append(line)
+                else:
+                    uninstall_output.append(line)
+        finally:
+            shell_lines.close()
+
+        # The shell failed before every package was reported (_iter_shell handles status)
+        for package_name in package_names[done:]:
+            self.invalidate_package_cache(serial, package_name)
+            yield package_name, "failed"
+
+
+    def _removal_result(self, package_name, uninstall_output, disabling, disable_output, disable_rc):
+        """Turns one package's part of the remove_packages_iter output into its result, reporting status."""
+        if not disabling:
+            self._update_status(f"Successfully uninstalled {package_name}.", level="info")
+            return "success"
+
+        uninstall_text = uninstall_output.decode('utf-8', errors='replace').strip()
+        disable_text = disable_output.decode('utf-8', errors='replace').strip()
+        self._update_status(f"Uninstall failed for {package_name} ({uninstall_text}), disabling it instead...", level="warning")
+        # Same success rules as disable_package
+        if disable_rc == 0 and disable_text:
+            if not _disabled_state_re(package_name).search(disable_text):
+                self._update_status(f"Disable command sent for {package_name}, but output was unexpected: {disable_text}", level="warning")
+            else:
+                self._update_status(f"Successfully disabled {package_name}.", level="info")
+            return "disabled"
+        return "failed"
+
+
+    def invalidate_package_cache(self, serial, package_name=None):
+        """
+        Forgets cached package details for one package, or for all packages of a device.
+
+        Args:
+            serial: The serial number or IP:port of the device.
+            package_name: The package to forget, or None for every package of the device.
+        """
+        if package_name is not None:
+            self._pkg_details_cache.pop((serial, package_name), None)
+        else:
+            for key in [key for key in self._pkg_details_cache if key[0] == serial]:
+                del self._pkg_details_cache[key]
+
+
+    def get_package_details(self, serial, package_name, include_permissions=True):
         """
         Retrieves detailed information about a specific package.
         Returns a dictionary with details.
+
+        Args:
+            serial: The serial number or IP:port of the target device.
+            package_name: The package to inspect.
+            include_permissions: If False, the requested permissions are not fetched ('permissions' may be empty)
+                                 and only the scalar fields are transferred from the device, which is much faster.
         """
         if not self.adb_available: return None
         if not serial or not package_name: return None
+        if not self._is_serial_known(serial): return None
+
+        # Package details rarely change during a session, so recent results are reused.
+        # Copies are returned so callers cannot modify the cached entry.
+        # An entry without permissions only serves callers that do not need them.
+        cache_key = (serial, package_name)
+        cached = self._pkg_details_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.PACKAGE_DETAILS_TTL and (cached[2] or not include_permissions):
+            return dict(cached[1], permissions=list(cached[1]['permissions']))
 
         self._update_status(f"Fetching details for {package_name}...", level="info")
 
-        # We use 'dumpsys package' to get details. It's verbose, so we might want to just grep relevant lines if possible,
-        # but parsing in Python is more robust against cross-platform shell differences.
-        command = ['adb', '-s', serial, 'shell', 'dumpsys', 'package', package_name]
-        stdout, stderr, returncode = self._run_adb_command(command, timeout=10)
+        # We use 'dumpsys package' to get details. Its full output is verbose (permissions, components, ...),
+        # so without permissions only the lines of the fields we parse are sent back (grep runs on the device).
+        # '|| true' keeps a package without any matching line from counting as a command failure.
+        if include_permissions:
+            cmdline = f"dumpsys package {package_name}"
+        else:
+            cmdline = f"dumpsys package {package_name} | grep -E '{_DUMPSYS_FIELD_GREP}' || true"
+        stdout, stderr, returncode = self._run_shell(serial, cmdline, timeout=10)
+        has_permissions = include_permissions
+
+        # The filtered query can come back without any field even though the package exists
+        # (no grep -E in the device toolbox, unusual dumpsys format). Parse the full dump then.
+        if not include_permissions and stdout is not None and (returncode != 0 or not _DUMPSYS_FIELD_RE.search(stdout)):
+            stdout, stderr, returncode = self._run_shell(serial, f"dumpsys package {package_name}", timeout=10)
+            has_permissions = True
 
-        details = {
-            'package_name': package_name,
-            'version_name': 'Unknown',
-            'version_code': 'Unknown',
-            'installer': 'Unknown',
-            'first_install_time': 'Unknown',
-            'last_update_time': 'Unknown',
-            'uid': 'Unknown',
-            'permissions': []
-        }
+        details = dict(_PACKAGE_DETAILS_TEMPLATE, package_name=package_name, permissions=[])
 
         if returncode == 0 and stdout:
-            lines = stdout.splitlines()
-            reading_perms = False
-            for line in lines:
-                line = line.strip()
-                if line.startswith('versionName='):
-                    details['version_name'] = line.split('=', 1)[1]
-                elif line.startswith('versionCode='):
-                    details['version_code'] = line.split('=', 1)[1].split(' ', 1)[0] # Handle "123 minSdk=..."
-                elif line.startswith('installerPackageName='):
-                    details['installer'] = line.split('=', 1)[1]
-                elif line.startswith('firstInstallTime='):
-                    details['first_install_time'] = line.split('=', 1)[1]
-                elif line.startswith('lastUpdateTime='):
-                    details['last_update_time'] = line.split('=', 1)[1]
-                elif line.startswith('userId='):
-                    details['uid'] = line.split('=', 1)[1]
-                elif line.startswith('requested permissions:'):
-                    reading_perms = True
-                elif reading_perms:
-                    if line.startswith('install permissions:') or line.startswith('runtime permissions:') or line == "":
-                        reading_perms = False
-                    else:
-                        details['permissions'].append(line)
+            # One scan for all "key=value" fields. A field can appear more than once
+            # (e.g. a hidden system package section), the last occurrence wins.
+            for match in _DUMPSYS_FIELD_RE.finditer(stdout):
+                value = match.group(2).rstrip()
+                if match.group(1) == 'versionCode':
+                    value = value.split(' ', 1)[0] # Handle "123 minSdk=..."
+                details[_DUMPSYS_FIELD_MAP[match.group(1)]] = value
+
+            # Only the lines of the permissions block(s) are split, not the whole output
+            for match in _REQUESTED_PERMS_RE.finditer(stdout):
+                details['permissions'].extend(line.strip() for line in match.group(2).splitlines() if line.strip())
+
+            self._pkg_details_cache[cache_key] = (time.monotonic(), dict(details, permissions=list(details['permissions'])), has_permissions)
 
         return details
 
 
-    def start_logcat(self, serial, callback):
+    def start_logcat(self, serial, callback, filterspec=None, regex=None, buffers=None, buffer_size=None):
         """
         Starts a logcat stream in a separate thread.
+        Filtering is done by logcat on the device, so filtered-out lines never cross USB/TCP.
         Args:
             serial: Device serial.
-            callback: Function to call with each new line of log (str).
+            callback: Function to call with each new batch of log lines (a list of str, without newlines).
+            filterspec: Optional logcat filterspecs, e.g. "*:W MyTag:V" (default: everything).
+            regex: Optional regex that messages must match (logcat --regex).
+            buffers: Optional comma-separated buffers to read, e.g. "main,crash" (default: logcat's own default).
+            buffer_size: Optional device log ring buffer size to request first ('logcat -G', e.g. "4M"),
+                         so bursts don't wrap the buffer before adb reads them. This changes a device-wide
+                         setting that stays until the device reboots, so it is off unless asked for.
         """
         if not self.adb_available or not serial:
             self._update_status("Cannot start Logcat: ADB unavailable or no device.", level="error")
             return
+        if not self._is_serial_known(serial):
+            return
 
-        if self.logcat_process:
-            self.stop_logcat()
+        # Also cancels a session still resizing the device buffer
+        self.stop_logcat()
 
-        self._stop_logcat_event.clear()
-        
         # Clear buffer first?
-        # self._run_adb_command(['adb', '-s', serial, 'logcat', '-c'], timeout=5)
+        # self._run_adb_command(self._device_command(serial, 'logcat', '-c'), timeout=5)
+
+        command = self._device_command(serial, 'logcat', '-v', 'time')
+        if buffers:
+            command += ('-b', buffers)
+        if regex:
+            command += ('--regex', regex)
+        if filterspec:
+            command += tuple(filterspec.split())
+
+        # Each session gets its own stop event, so a reader that is still winding down
+        # can never be confused with the session started after it.
+        stop_event = threading.Event()
+        with self._logcat_lock:
+            self._stop_logcat_event = stop_event
+
+        if buffer_size:
+            # Resized before the stream starts, so this session benefits; in the background so the caller never waits
+            threading.Thread(target=self._resize_logcat_buffer_then_stream,
+                             args=(serial, buffers, buffer_size, command, callback, stop_event), daemon=True).start()
+        else:
+            self._start_logcat_stream(serial, command, callback, stop_event)
+
+
+    def _resize_logcat_buffer_then_stream(self, serial, buffers, buffer_size, command, callback, stop_event):
+        """
+        Requests a device log buffer size with a one-shot 'adb logcat -G', then starts the logcat stream
+        (runs in its own thread). The persistent shell is not used, so no other device command waits for this.
+        The request is best effort: a device refusing or capping the size just keeps its own buffers.
+        """
+        resize_command = self._device_command(serial, 'logcat')
+        if buffers:
+            resize_command += ('-b', buffers)
+        resize_command += ('-G', buffer_size)
+        try:
+            subprocess.run(resize_command, capture_output=True, timeout=5, check=False, **self._popen_kwargs)
+        except Exception:
+            pass # Best effort: not worth an error in the status bar
+        if not stop_event.is_set():
+            self._start_logcat_stream(serial, command, callback, stop_event)
+
+
+    def _start_logcat_stream(self, serial, command, callback, stop_event):
+        """Spawns the logcat process of a session and its reader/dispatcher threads (see start_logcat)."""
+        try:
+            # Use subprocess.Popen for continuous stream.
+            # Binary and unbuffered: output is read in chunks straight from the pipe and each
+            # complete line is decoded once, instead of going through a text-mode readline.
+            # stderr is merged so adb errors (e.g. device gone) show up in the log itself.
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=0,
+                **self._popen_kwargs
+            )
+        except Exception as e:
+            self._update_status(f"Logcat error: {e}", level="error")
+            return
+
+        with self._logcat_lock:
+            stopped = stop_event.is_set() # stop_logcat (or a newer start_logcat) came first
+            if not stopped:
+                self.logcat_process = process
+        if stopped:
+            process.stdout.close() # No reader was started for this pipe
+            threading.Thread(target=self._end_logcat_process, args=(process,), daemon=True).start()
+            return
+
+        # Lines go through a bounded queue to a separate dispatcher thread, so a slow callback
+        # (e.g. a GUI text widget) never stops the reader from draining the adb pipe.
+        # When the queue is full, lines are dropped and counted instead of blocking.
+        line_queue = queue.Queue(maxsize=self.LOGCAT_QUEUE_SIZE)
+        dropped_lines = 0
+
+        def _enqueue_line(line):
+            nonlocal dropped_lines
+            try:
+                if dropped_lines:
+                    line_queue.put_nowait(f"--- {dropped_lines} log lines dropped (display too slow) ---")
+                    dropped_lines = 0
+                line_queue.put_nowait(line)
+            except queue.Full:
+                dropped_lines += 1
+
+        def _logcat_dispatcher():
+            # Lines are delivered in batches: after the first line arrives, more are collected
+            # for up to LOGCAT_BATCH_INTERVAL seconds (or LOGCAT_BATCH_SIZE lines),
+            # so a busy log costs one callback per batch instead of one per line.
+            finished = False
+            while not finished:
+                line = line_queue.get()
+                if line is None:
+                    break # Reader finished
+                batch = [line]
+                deadline = time.monotonic() + self.LOGCAT_BATCH_INTERVAL
+                while len(batch) < self.LOGCAT_BATCH_SIZE:
+                    try:
+                        line = line_queue.get(timeout=max(deadline - time.monotonic(), 0))
+                    except queue.Empty:
+                        break
+                    if line is None:
+                        finished = True
+                        break
+                    batch.append(line)
+                if stop_event.is_set():
+                    continue # Stopped: lines still queued are drained but no longer delivered
+                try:
+                    callback(batch)
+                except Exception as e:
+                    self._update_status(f"Logcat callback error: {e}", level="error")
 
-        command = ['adb', '-s', serial, 'logcat', '-v', 'time']
-        
         def _logcat_worker():
             try:
-                # Use subprocess.Popen for continuous stream
-                creationflags = 0
-                if sys.platform.startswith('win'):
-                    creationflags = subprocess.CREATE_NO_WINDOW
-                
-                self.logcat_process = subprocess.Popen(
-                    command,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    bufsize=1, # Line buffered
-                    encoding='utf-8',
-                    errors='replace',
-                    creationflags=creationflags
-                )
-
-                while not self._stop_logcat_event.is_set():
-                    line = self.logcat_process.stdout.readline()
-                    if not line and self.logcat_process.poll() is not None:
+                fd = process.stdout.fileno()
+
+                # One growing buffer for the whole session. Complete lines are decoded straight out of it
+                # through a memoryview, and consumed bytes are only dropped once they add up,
+                # so there is no per-read concatenation and no per-line bytes copy.
+                buffer = bytearray()
+                start = 0 # Index of the first byte not yet delivered
+                while not stop_event.is_set():
+                    # Returns as soon as any output is available (up to 64 KiB at once).
+                    # No select() here since it does not work on pipes on Windows.
+                    # After stop_logcat terminates adb, the read returns EOF once every writer of
+                    # the pipe is gone; stop_logcat does not wait for that.
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
                         break # Process ended
-                    if line:
-                        callback(line.rstrip())
+                    buffer += chunk
+                    with memoryview(buffer) as view:
+                        while True:
+                            end = buffer.find(b'\n', start)
+                            if end < 0:
+                                break # Incomplete last line, wait for the rest
+                            _enqueue_line(str(view[start:end], 'utf-8', 'replace').rstrip())
+                            start = end + 1
+                    if start == len(buffer) or start > 65536:
+                        del buffer[:start]
+                        start = 0
             except Exception as e:
-                self._update_status(f"Logcat error: {e}", level="error")
+                if not stop_event.is_set(): # Errors while stopping are expected
+                    self._update_status(f"Logcat error: {e}", level="error")
             finally:
-                self.stop_logcat()
+                # The reader owns the pipe: it is closed here, once nothing can be blocked reading it
+                try:
+                    process.stdout.close()
+                except Exception:
+                    pass
+                line_queue.put(None) # Let the dispatcher finish once it has delivered everything
+                # Logcat ended on its own (device gone, ...): clean up, unless stop_logcat already did
+                with self._logcat_lock:
+                    ended_here = self.logcat_process is process
+                    if ended_here:
+                        self.logcat_process = None
+                if ended_here:
+                    self._end_logcat_process(process)
 
         self.logcat_thread = threading.Thread(target=_logcat_worker, daemon=True)
         self.logcat_thread.start()
+        self.logcat_dispatch_thread = threading.Thread(target=_logcat_dispatcher, daemon=True)
+        self.logcat_dispatch_thread.start()
         self._update_status(f"Logcat started for {serial}.", level="info")
 
 
-        def stop_logcat(self):
-
-
-            """Stops the currently running logcat process."""
-
-
+    def stop_logcat(self):
+        """
+        Stops the currently running logcat process, if any, without waiting for it.
+        Safe to call from the GUI thread: the session's threads stop delivering lines right away,
+        and the process is reaped in the background.
+        """
+        with self._logcat_lock:
+            process, self.logcat_process = self.logcat_process, None
             self._stop_logcat_event.set()
+        if process:
+            try:
+                process.terminate()
+            except Exception:
+                pass
+            # Each session has its own stop event and queue, so its winding-down threads
+            # never mix with a session started right after this one
+            threading.Thread(target=self._end_logcat_process, args=(process,), daemon=True).start()
 
 
-            if self.logcat_process:
-
-
-                self.logcat_process.terminate()
-
-
-                try:
-
-
-                    self.logcat_process.wait(timeout=1)
-
-
-                except subprocess.TimeoutExpired:
-
-
-                    self.logcat_process.kill()
-
-
-                self.logcat_process = None
-
-
-                self._update_status("Logcat stopped.", level="info")
-
-
-    
\ No newline at end of file
+    def _end_logcat_process(self, process):
+        """Terminates a logcat process and reaps it, killing it if it does not exit quickly. Blocks, so runs off the GUI thread."""
+        try:
+            process.terminate()
+        except Exception:
+            pass
+        try:
+            process.wait(timeout=0.2)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            try:
+                process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                pass
+        self._update_status("Logcat stopped.", level="info")
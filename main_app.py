@@ -17,8 +17,13 @@
 import customtkinter as ctk
 import tkinter as tk
 import os
+import re
 import sys
 import threading # Import threading for potentially long ADB operations
+import concurrent.futures
+import functools
+import collections
+import time
 import tkinter.filedialog as filedialog # Needed for file selection dialog
 import tkinter.messagebox as messagebox # Still useful for other messages
 
@@ -26,7 +31,62 @@ import tkinter.messagebox as messagebox # Still useful for other messages
 # Import the adb_manager
 from adb_manager import AdbManager
 
+# First words of the placeholder texts the device dropdown can show ("No devices found", "ADB not found", ...)
+_PLACEHOLDER_TOKENS = frozenset(("No", "ADB", "Selected", "Searching...", "Loading..."))
+# Full placeholder texts of the device dropdown
+_PLACEHOLDER_ENTRIES = frozenset(("No devices found", "Searching...", "ADB not found", "Loading..."))
+# Device info values that mean "nothing usable to display"
+_INVALID_INFO = frozenset(("N/A", "Error"))
+# Level letter of a logcat line in 'time' format ("05-14 10:32:01.123 W/Tag( 1234): message")
+_LOGCAT_LEVEL_RE = re.compile(r"\d\d-\d\d \S+ ([VDIWEF])/")
+# Logcat textbox tag of each highlighted level (other levels are shown untagged)
+_LOGCAT_LEVEL_TAGS = {"W": "warning", "E": "error", "F": "error"}
+
+
+def _require_device(method):
+    """
+    Decorator for AdbGripperApp handlers that need a selected device and a working adb.
+    If either is missing, a warning is shown in the status bar and the handler is not called.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not (self.current_device_serial and self.adb_manager and self.adb_manager.adb_available):
+            self.update_status("No device selected or ADB not available.", level="warning")
+            return None
+        return method(self, *args, **kwargs)
+    return wrapper
+
 class AdbGripperApp(ctk.CTk):
+    # Number of worker threads running blocking ADB operations for the GUI (see self._pool)
+    ADB_WORKERS = 4
+    # Status messages arriving within this window are coalesced into one status bar update
+    STATUS_FLUSH_DELAY_MS = 30
+    # Age in seconds after which cached device info is shown but refetched (only the battery level can change)
+    DEVICE_INFO_TTL = 30.0
+    # Selecting a device that is gone refreshes the device list only if the last refresh is older than this (seconds)
+    STALE_REFRESH_INTERVAL = 2.0
+    # The app list is refreshed this long after the last User/All Apps filter change, so quick toggling lists once
+    APP_FILTER_DEBOUNCE_MS = 250
+    # Height in pixels of one row of the app list canvas
+    APP_ROW_HEIGHT = 28
+    # Colors of the app list rows by uninstall result
+    APP_RESULT_COLORS = {"success": "green", "disabled": "orange", "failed": "red"}
+    APP_RESULT_LABELS = {"success": "Uninstalled", "disabled": "Disabled", "failed": "Failed"}
+    # Uninstall results arriving within this window are marked on the app list together
+    UNINSTALL_FLUSH_DELAY_MS = 50
+    # The details popup adds permissions to its list this many at a time, as the list is scrolled down
+    PERMISSIONS_PAGE_SIZE = 200
+    # The uninstall confirmation dialog lists at most this many of the selected packages
+    CONFIRMATION_MAX_LISTED = 100
+    # Delay between the first queued logcat batch and the drain that moves everything queued into the textbox
+    LOGCAT_DRAIN_DELAY_MS = 80
+    # Keys handled normally by the read-only logcat textbox (see _block_logcat_edit)
+    _LOGCAT_NAVIGATION_KEYS = frozenset(("Up", "Down", "Left", "Right", "Prior", "Next", "Home", "End"))
+    # The logcat textbox keeps at most this many lines; older ones are dropped
+    MAX_LOGCAT_LINES = 20000
+    # Lines allowed above MAX_LOGCAT_LINES before trimming, so the oldest lines are deleted in batches
+    LOGCAT_TRIM_SLACK = 2000
+
     def __init__(self):
         super().__init__()
 
@@ -36,25 +96,68 @@ class AdbGripperApp(ctk.CTk):
         self.minsize(600, 400)
         ctk.set_appearance_mode("System") # Modes: "System" (default), "Dark", "Light"
         ctk.set_default_color_theme("blue") # Themes: "blue" (default), "green", "dark-blue"
+        # Font of all bold labels, created once and shared (including the labels of every details popup)
+        self.bold_font = ctk.CTkFont(weight="bold")
+
+        # Status bar coalescing: only the latest message of a burst is rendered (see update_status)
+        # Set up before AdbManager, which reports its adb check through update_status.
+        self._pending_status = None # (message, color) waiting to be shown
+        self._status_scheduled = False # True while a _flush_status call is queued on the main loop
+        self._status_lock = threading.Lock()
+        # Worker threads for blocking ADB operations: rapid clicks queue up here instead of each starting a thread
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.ADB_WORKERS, thread_name_prefix="adb")
 
         # --- AdbManager Instance ---
-        # Create an instance of AdbManager, passing the status update method
-        # This checks for ADB availability on initialization
-        self.adb_manager = AdbManager(self.update_status)
+        # Created by _init_adb once the window is up, so the ADB availability check does not delay the first paint
+        self.adb_manager = None
         self.current_device_serial = None # Variable to store the currently selected device identifier
         self.selected_apk_path = None # Variable to store the path of the selected APK file
+        self._apk_path_valid = False # Whether selected_apk_path was an existing file when it was selected
+        self._apk_mtime = None # Modification time of the selected APK when it was selected (checked again before installing)
 
         # Dictionary to store device info fetched by list_devices (serial -> device dict from adb devices -l)
         self.available_devices_info = {}
-        # List to store the currently displayed app package names in the uninstall list
-        self.current_app_packages = []
-        # Dictionary to hold references to the app checkboxes for easy access {package_name: CTkCheckBox_widget}
-        self.app_checkboxes = {}
+        # Dropdown entry text -> serial, built together with the entries
+        self._display_to_serial = {}
+        # Session cache of the info fetched per device ((serial, state) -> get_device_info dict).
+        # A plain Refresh reuses these entries, so only new devices (or devices whose state changed) hit ADB.
+        self._device_prop_cache = {}
+        # When the cached info of each device was fetched (serial -> time.monotonic()), for DEVICE_INFO_TTL
+        self._device_info_ts = {}
+        # When list_devices_in_gui last started a refresh (time.monotonic()), see STALE_REFRESH_INTERVAL
+        self._last_list_devices_ts = 0.0
+        # True from the start of a device listing until its result is shown in the dropdown
+        self._device_listing = False
+        # (serial, state) set of the latest tracked device push that arrived while a listing was running, else None
+        self._pending_device_states = None
+        # Sorted tuple of the app package names currently displayed in the uninstall list
+        self.current_app_packages = ()
+        # Sorted package tuples already listed, by (serial, user_only); reused until Refresh List or an install/uninstall
+        self._app_list_cache = {}
+        # Rows of the virtualized app list, all parallel to each other (index = row, sorted by package name)
+        self._pkg_names = [] # Package name of each row
+        self._selected_packages = set() # Names of the selected rows, kept up to date on every change
+        self._pkg_results = [] # Uninstall result of each row ("success" | "disabled" | "failed"), None if untouched
+        self._pkg_index = {} # package_name -> row index
+        self._app_list_empty_text = None # Message drawn when the list has no rows
+        self._app_list_serial = None # Device whose packages the rows show
+        self._list_apps_after_id = None # Pending debounced app list refresh (see on_app_filter_change)
 
         # Variable to hold the reference to the confirmation dialog window
         self.confirmation_dialog = None
+        self._conf_warning_label = None # Widgets of the confirmation dialog updated on reuse (see _ensure_confirmation_dialog)
+        self._conf_textbox = None
         # Variable to temporarily store packages selected for uninstall during confirmation
         self._packages_to_uninstall_in_dialog = []
+        # Uninstall results handed over by the uninstall thread, marked on the list by _flush_uninstall_results
+        self._uninstall_results = collections.deque()
+        self._uninstall_flush_scheduled = False
+
+        # Logcat batches handed over by the reader thread, drained by _drain_logcat on the main loop
+        self._logcat_queue = collections.deque() # append/popleft are thread-safe
+        self._logcat_drain_scheduled = False # True while a _drain_logcat call is queued on the main loop
+        # The lines shown in the logcat textbox (without newlines), trimmed along with it; save_logcat_gui writes these
+        self._logcat_lines = collections.deque()
 
 
         # --- Layout Configuration ---
@@ -66,9 +169,9 @@ class AdbGripperApp(ctk.CTk):
         # Row 0: Top connection area, Row 1: Main content + sidebar, Row 2: Status bar
         # weight 0 means the row height is determined by the widgets inside it
         # weight 1 means the row takes up any extra vertical space
-        self.grid_rowconfigure(0, weight=0)
+        # Tk accepts a list of indices, so rows/columns sharing a weight are configured in one call
+        self.grid_rowconfigure((0, 2), weight=0)
         self.grid_rowconfigure(1, weight=1)
-        self.grid_rowconfigure(2, weight=0)
 
         # --- Create Main Frames/Pads ---
 
@@ -78,15 +181,12 @@ class AdbGripperApp(ctk.CTk):
         # Place in row 0, spanning both columns (0 and 1), sticking to all sides (nsew) of the grid cell
         self.connection_frame.grid(row=0, column=0, columnspan=2, sticky="nsew", padx=10, pady=5)
         # Configure the grid layout *within* the connection_frame for its widgets
-        self.connection_frame.grid_columnconfigure(0, weight=0) # "Connected Devices:" label (fixed width)
-        self.connection_frame.grid_columnconfigure(1, weight=1) # Device Dropdown (expands)
-        self.connection_frame.grid_columnconfigure(2, weight=0) # Refresh button (fixed width)
-        self.connection_frame.grid_columnconfigure(3, weight=0) # "Connect IP:" label (fixed width)
-        self.connection_frame.grid_columnconfigure(4, weight=1) # IP Entry (expands)
-        self.connection_frame.grid_columnconfigure(5, weight=0) # Connect button (fixed width)
-        self.connection_frame.grid_columnconfigure(6, weight=2) # Spacer column to push elements left (takes more space)
-        self.connection_frame.grid_rowconfigure(0, weight=1) # Top row for connection controls
-        self.connection_frame.grid_rowconfigure(1, weight=1) # Bottom row for the selected device label
+        # Fixed width: "Connected Devices:" label (0), Refresh button (2), "Connect IP:" label (3), Connect button (5)
+        self.connection_frame.grid_columnconfigure((0, 2, 3, 5), weight=0)
+        # Expanding: Device Dropdown (1), IP Entry (4), Spacer column to push elements left (6)
+        self.connection_frame.grid_columnconfigure((1, 4, 6), weight=1)
+        # Top row for connection controls (0), bottom row for the selected device label (1)
+        self.connection_frame.grid_rowconfigure((0, 1), weight=1)
 
 
         # Add widgets to the Connection Frame (placed using the connection_frame's internal grid)
@@ -99,25 +199,27 @@ class AdbGripperApp(ctk.CTk):
         # Bind the selection event - "<<ComboboxSelected>>" is a standard tkinter event name
         self.device_combobox.bind("<<ComboboxSelected>>", self.on_device_selected)
 
-        # Refresh Button
-        self.refresh_button = ctk.CTkButton(self.connection_frame, text="Refresh", command=self.list_devices_in_gui)
+        # Refresh Button (enabled by _init_adb when adb is found)
+        self.refresh_button = ctk.CTkButton(self.connection_frame, text="Refresh", command=self.list_devices_in_gui, state="disabled")
         self.refresh_button.grid(row=0, column=2, padx=(0, 20), pady=5, sticky="w")
+        # Shift-click forces a full refresh that bypasses the device info cache.
+        # Being more specific than the button's own release binding, it replaces the normal command for that click.
+        self.refresh_button.bind("<Shift-ButtonRelease-1>", self._force_refresh_devices)
 
         # IP Connect Controls
         ctk.CTkLabel(self.connection_frame, text="Connect IP:").grid(row=0, column=3, padx=(0, 5), pady=5, sticky="w")
         self.ip_entry = ctk.CTkEntry(self.connection_frame, placeholder_text="e.g., 192.168.1.10:5555")
         self.ip_entry.grid(row=0, column=4, padx=(0, 10), pady=5, sticky="ew")
 
-        self.connect_ip_button = ctk.CTkButton(self.connection_frame, text="Connect", command=self.connect_device_by_ip)
+        self.connect_ip_button = ctk.CTkButton(self.connection_frame, text="Connect", command=self.connect_device_by_ip, state="disabled")
         self.connect_ip_button.grid(row=0, column=5, padx=(0, 0), pady=5, sticky="w") # Reduced padx here
 
-        # Spacer column to push other elements to the left
-        self.connection_frame.grid_columnconfigure(6, weight=1)
-
 
         # Label to show currently selected device, spanning across all columns of the connection_frame
         # This label will show "Commercial Name (Model) (Serial)" after fetching info
-        self.selected_device_label = ctk.CTkLabel(self.connection_frame, text="Selected Device: None", font=ctk.CTkFont(weight="bold"))
+        # Label texts live in StringVars: one var.set() redraws the label without a 'configure' round-trip per update
+        self.selected_device_var = tk.StringVar(self, value="Selected Device: None")
+        self.selected_device_label = ctk.CTkLabel(self.connection_frame, textvariable=self.selected_device_var, font=self.bold_font)
         self.selected_device_label.grid(row=1, column=0, columnspan=7, padx=5, pady=(0, 5), sticky="w")
 
 
@@ -130,28 +232,29 @@ class AdbGripperApp(ctk.CTk):
 
 
         # Add labels for Device Info (will be populated after device selection)
-        ctk.CTkLabel(self.info_frame, text="Device Information", font=ctk.CTkFont(weight="bold")).grid(row=0, column=0, padx=10, pady=(10, 5), sticky="w")
-        self.serial_display_label = ctk.CTkLabel(self.info_frame, text="Serial: N/A", anchor="w") # Display selected device serial
+        ctk.CTkLabel(self.info_frame, text="Device Information", font=self.bold_font).grid(row=0, column=0, padx=10, pady=(10, 5), sticky="w")
+        self.serial_var = tk.StringVar(self, value="Serial: N/A")
+        self.model_var = tk.StringVar(self, value="Model: N/A")
+        self.commercial_name_var = tk.StringVar(self, value="Commercial Name: N/A")
+        self.android_version_var = tk.StringVar(self, value="Android Version: N/A")
+        self.battery_level_var = tk.StringVar(self, value="Battery Level: N/A")
+        self.serial_display_label = ctk.CTkLabel(self.info_frame, textvariable=self.serial_var, anchor="w") # Display selected device serial
         self.serial_display_label.grid(row=1, column=0, padx=10, pady=2, sticky="w")
-        self.model_label = ctk.CTkLabel(self.info_frame, text="Model: N/A", anchor="w")
+        self.model_label = ctk.CTkLabel(self.info_frame, textvariable=self.model_var, anchor="w")
         self.model_label.grid(row=2, column=0, padx=10, pady=2, sticky="w")
         # Add Commercial Name Label
-        self.commercial_name_label = ctk.CTkLabel(self.info_frame, text="Commercial Name: N/A", anchor="w")
+        self.commercial_name_label = ctk.CTkLabel(self.info_frame, textvariable=self.commercial_name_var, anchor="w")
         self.commercial_name_label.grid(row=3, column=0, padx=10, pady=2, sticky="w")
 
-        self.android_version_label = ctk.CTkLabel(self.info_frame, text="Android Version: N/A", anchor="w")
+        self.android_version_label = ctk.CTkLabel(self.info_frame, textvariable=self.android_version_var, anchor="w")
         self.android_version_label.grid(row=4, column=0, padx=10, pady=2, sticky="w") # Shifted down
 
-        self.battery_level_label = ctk.CTkLabel(self.info_frame, text="Battery Level: N/A", anchor="w") # Add Battery Level Label
+        self.battery_level_label = ctk.CTkLabel(self.info_frame, textvariable=self.battery_level_var, anchor="w") # Add Battery Level Label
         self.battery_level_label.grid(row=5, column=0, padx=10, pady=2, sticky="w") # Added new row
 
         # Configure rows in info_frame to not expand the top labels, pushing extra space down
-        self.info_frame.grid_rowconfigure(0, weight=0)
-        self.info_frame.grid_rowconfigure(1, weight=0)
-        self.info_frame.grid_rowconfigure(2, weight=0)
-        self.info_frame.grid_rowconfigure(3, weight=0) # Row for Commercial Name
-        self.info_frame.grid_rowconfigure(4, weight=0) # Row for Android Version
-        self.info_frame.grid_rowconfigure(5, weight=0) # Row for Battery Level
+        # Rows: title, Serial, Model, Commercial Name, Android Version, Battery Level
+        self.info_frame.grid_rowconfigure(tuple(range(6)), weight=0)
         self.info_frame.grid_rowconfigure(6, weight=1) # Dummy row with weight 1
 
 
@@ -164,6 +267,11 @@ class AdbGripperApp(ctk.CTk):
         self.device_control_tab = self.functionality_tabview.add("Device Control")
         self.app_management_tab = self.functionality_tabview.add("App Management")
         self.logcat_tab = self.functionality_tabview.add("Logcat")
+        # Only the Device Control tab is populated at startup; the other tabs are built the first time they are opened
+        self._app_management_built = False
+        self._logcat_built = False
+        self._functionality_enabled = False # Last state passed to enable_functionality_widgets, applied to tabs built later
+        self.functionality_tabview.configure(command=self._on_tab_changed)
 
 
         # --- Populate Device Control Tab ---
@@ -203,13 +311,129 @@ class AdbGripperApp(ctk.CTk):
         self.power_off_button.grid(row=3, column=0, padx=20, pady=10, sticky="ew")
 
         # Configure rows in Device Control tab to not expand unnecessarily, push space below buttons
-        self.functionality_tabview.tab("Device Control").grid_rowconfigure(0, weight=0)
-        self.functionality_tabview.tab("Device Control").grid_rowconfigure(1, weight=0)
-        self.functionality_tabview.tab("Device Control").grid_rowconfigure(2, weight=0)
-        self.functionality_tabview.tab("Device Control").grid_rowconfigure(3, weight=0)
+        self.functionality_tabview.tab("Device Control").grid_rowconfigure((0, 1, 2, 3), weight=0) # Button rows
         self.functionality_tabview.tab("Device Control").grid_rowconfigure(4, weight=1) # Spacer row
 
 
+        # Bottom Frame (Status Bar)
+        # Placed in row 2, spanning both columns. Fixed height.
+        self.status_frame = ctk.CTkFrame(self, height=30, fg_color="gray") # Give it a distinct color for visibility
+        self.status_frame.grid(row=2, column=0, columnspan=2, sticky="nsew", padx=10, pady=5)
+        # Configure grid within status_frame for the label
+        self.status_frame.grid_columnconfigure(0, weight=1)
+        self.status_frame.grid_rowconfigure(0, weight=1)
+
+        # Label to display status messages, anchored to the west (left)
+        self.status_label = ctk.CTkLabel(self.status_frame, text="Initializing...", anchor="w") # Initial status text
+        self.status_label.grid(row=0, column=0, sticky="nsew", padx=5) # 'nsew' makes label fill the status frame
+
+
+        # Release background adb resources (persistent shells) when the window is closed
+        self.protocol("WM_DELETE_WINDOW", self.on_closing)
+
+
+        # --- Initial Actions ---
+        # Set Window Icon
+        try:
+            # Handle path for PyInstaller (sys._MEIPASS) or normal run
+            if getattr(sys, 'frozen', False):
+                application_path = sys._MEIPASS
+            else:
+                application_path = os.path.dirname(os.path.abspath(__file__))
+            
+            icon_path = os.path.join(application_path, "mon_icone.ico")
+            
+            if os.path.exists(icon_path):
+                # On Windows, iconbitmap works with .ico
+                # On Linux, it often requires a bitmap or fails with .ico depending on the WM.
+                # We try a generic approach.
+                if sys.platform.startswith("win"):
+                    self.iconbitmap(icon_path)
+                else:
+                    # For Linux/Mac, trying to set the icon. 
+                    # Note: iconbitmap with .ico might fail on some Linux WMs.
+                    # Ideally we would use a png and tk.PhotoImage, but we only have .ico.
+                    # We attempt it, catching errors to avoid crash.
+                    try:
+                        self.wm_iconbitmap(bitmap=f"@{icon_path}")
+                    except Exception:
+                        pass # specific linux icon setting might fail without .xbm or .png
+            
+        except Exception as e:
+            print(f"Warning: Could not set icon: {e}")
+
+        # Functionality tabs/buttons stay disabled until a device is selected
+        self.enable_functionality_widgets(False)
+
+        # Let the window paint ("Initializing..." in the status bar) before looking for adb
+        self.after(10, self._init_adb)
+
+
+    def _init_adb(self):
+        """Creates the AdbManager (which checks for ADB availability) and starts the first device listing."""
+        # Create an instance of AdbManager, passing the status update method
+        self.adb_manager = AdbManager(self.update_status)
+
+        # Automatically list devices on startup if ADB is available
+        if self.adb_manager.adb_available:
+             self.refresh_button.configure(state="normal")
+             self.connect_ip_button.configure(state="normal")
+             # Run the first device listing in a thread on startup to avoid freezing UI
+             self._device_listing = True
+             self._pool.submit(self._start_adb_threaded)
+        else:
+             # If adb is not available, update GUI elements and status
+             self.device_combobox.set("ADB not found")
+             self.device_combobox.configure(state="disabled")
+             self.update_status("ADB command not found. Please install Android SDK Platform-Tools.", level="error")
+
+
+    def _start_adb_threaded(self):
+        """Subscribes to device changes pushed by the adb server, then lists the devices (runs in a thread)."""
+        # Once tracking runs, device changes refresh the list by themselves and listing needs no adb process
+        self.adb_manager.start_device_tracking(self._on_devices_changed)
+        self._perform_list_devices_threaded()
+
+
+    def _on_devices_changed(self, devices):
+        """Called from AdbManager's tracking thread with the new device list; hands it to the main thread."""
+        self.after(0, self._handle_devices_changed_gui, devices)
+
+
+    def _handle_devices_changed_gui(self, devices):
+        """Refreshes the device dropdown when the set of devices (or their states) actually changed."""
+        new_states = {(dev['serial'], dev['state']) for dev in devices}
+        if self._device_listing:
+            # The running listing may have read the device list before this push; it is compared
+            # (and listed again if needed) once that listing is shown, see _update_device_list_gui
+            self._pending_device_states = new_states
+        elif new_states != self._shown_device_states(): # The first push just repeats the startup listing
+            self.list_devices_in_gui()
+
+
+    def _shown_device_states(self):
+        """Returns the (serial, state) set of the devices the dropdown currently lists."""
+        return {(serial, dev.get('state')) for serial, dev in self.available_devices_info.items()}
+
+
+    # --- Lazy Tab Construction ---
+    def _on_tab_changed(self):
+        """Builds the selected tab the first time it is opened."""
+        selected_tab = self.functionality_tabview.get()
+        if selected_tab == "App Management" and not self._app_management_built:
+            self._build_app_management_tab()
+            # Bring the new widgets in line with the current device state, and list the apps of the selected device
+            self.enable_functionality_widgets(self._functionality_enabled)
+            if self._functionality_enabled and self.current_device_serial:
+                self.list_apps_in_gui(use_cache=True)
+        elif selected_tab == "Logcat" and not self._logcat_built:
+            self._build_logcat_tab()
+
+
+    def _build_app_management_tab(self):
+        """Creates the widgets of the App Management tab (install section and uninstall list)."""
+        self._app_management_built = True
+
         # --- Populate App Management Tab ---
         self.functionality_tabview.tab("App Management").grid_columnconfigure(0, weight=1) # Single column for content
 
@@ -217,10 +441,8 @@ class AdbGripperApp(ctk.CTk):
         self.install_frame = ctk.CTkFrame(self.functionality_tabview.tab("App Management"), fg_color="transparent")
         self.install_frame.grid(row=0, column=0, padx=20, pady=(10, 5), sticky="nsew")
         # Configure grid within install_frame
-        self.install_frame.grid_columnconfigure(0, weight=0) # Label
+        self.install_frame.grid_columnconfigure((0, 2, 3), weight=0) # Label, Browse button, Install button
         self.install_frame.grid_columnconfigure(1, weight=1) # Entry/Label for path (takes space)
-        self.install_frame.grid_columnconfigure(2, weight=0) # Browse button
-        self.install_frame.grid_columnconfigure(3, weight=0) # Install button
 
 
         ctk.CTkLabel(self.install_frame, text="Install APK:").grid(row=0, column=0, padx=(0, 10), pady=5, sticky="w")
@@ -244,8 +466,7 @@ class AdbGripperApp(ctk.CTk):
         self.uninstall_frame.grid(row=1, column=0, padx=20, pady=(5, 10), sticky="nsew")
         # Configure grid within uninstall_frame
         self.uninstall_frame.grid_columnconfigure(0, weight=1) # Give the list area space
-        self.uninstall_frame.grid_rowconfigure(0, weight=0) # Controls row
-        self.uninstall_frame.grid_rowconfigure(1, weight=0) # Warning row
+        self.uninstall_frame.grid_rowconfigure((0, 1), weight=0) # Controls row, Warning row
         self.uninstall_frame.grid_rowconfigure(2, weight=1) # App list row
 
         # Add this line to make the row containing uninstall_frame expand vertically
@@ -255,12 +476,9 @@ class AdbGripperApp(ctk.CTk):
         # Uninstall Controls (Filter options, Refresh button, Uninstall button)
         self.uninstall_controls_frame = ctk.CTkFrame(self.uninstall_frame, fg_color="transparent")
         self.uninstall_controls_frame.grid(row=0, column=0, sticky="nsew", pady=(0, 5))
-        self.uninstall_controls_frame.grid_columnconfigure(0, weight=0) # Label
-        self.uninstall_controls_frame.grid_columnconfigure(1, weight=0) # Segmented Button
+        # Label, Segmented Button, Refresh Button, Details Button, Uninstall Button
+        self.uninstall_controls_frame.grid_columnconfigure((0, 1, 3, 4, 5), weight=0)
         self.uninstall_controls_frame.grid_columnconfigure(2, weight=1) # Spacer
-        self.uninstall_controls_frame.grid_columnconfigure(3, weight=0) # Refresh Button
-        self.uninstall_controls_frame.grid_columnconfigure(4, weight=0) # Details Button
-        self.uninstall_controls_frame.grid_columnconfigure(5, weight=0) # Uninstall Button
 
         ctk.CTkLabel(self.uninstall_controls_frame, text="Show:").grid(row=0, column=0, padx=(0, 10), sticky="w")
 
@@ -270,9 +488,6 @@ class AdbGripperApp(ctk.CTk):
         self.app_filter_button.grid(row=0, column=1, padx=(0, 20), sticky="w")
         self.app_filter_button.set("User Apps") # Default selection
 
-        # Spacer
-        self.uninstall_controls_frame.grid_columnconfigure(2, weight=1)
-
         self.refresh_app_list_button = ctk.CTkButton(self.uninstall_controls_frame, text="Refresh List", command=self.list_apps_in_gui)
         self.refresh_app_list_button.grid(row=0, column=3, padx=(0, 10), sticky="w")
 
@@ -289,12 +504,33 @@ class AdbGripperApp(ctk.CTk):
         # Set initial text for "User Apps" mode (done by setting default above)
 
 
-        # Frame to contain the scrollable app list (populated dynamically)
-        self.app_list_scrollable_frame = ctk.CTkScrollableFrame(self.uninstall_frame)
-        self.app_list_scrollable_frame.grid(row=2, column=0, sticky="nsew", pady=(0, 10))
-        # Configure grid inside the scrollable frame for app entries (Checkbox + Label)
-        # These column weights will be set when populating the list
-
+        # Frame to contain the scrollable app list
+        # The list is drawn on a single canvas and only the visible rows exist at any time,
+        # so listing hundreds of packages does not create hundreds of widgets.
+        self.app_list_frame = ctk.CTkFrame(self.uninstall_frame)
+        self.app_list_frame.grid(row=2, column=0, sticky="nsew", pady=(0, 10))
+        self.app_list_frame.grid_columnconfigure(0, weight=1) # Canvas (takes space)
+        self.app_list_frame.grid_columnconfigure(1, weight=0) # Scrollbar
+        self.app_list_frame.grid_rowconfigure(0, weight=1)
+
+        self.app_list_font = ctk.CTkFont()
+        self.app_list_canvas = ctk.CTkCanvas(self.app_list_frame, highlightthickness=0, borderwidth=0,
+                                             yscrollincrement=self.APP_ROW_HEIGHT)
+        self.app_list_canvas.grid(row=0, column=0, sticky="nsew", padx=(5, 0), pady=5)
+        self.app_list_scrollbar = ctk.CTkScrollbar(self.app_list_frame, command=self.app_list_canvas.yview)
+        self.app_list_scrollbar.grid(row=0, column=1, sticky="ns", pady=5)
+        # Every view change (scrolling, resizing, new content) goes through yscrollcommand, which redraws the visible rows
+        self.app_list_canvas.configure(yscrollcommand=self._on_app_list_scrolled)
+        self.app_list_canvas.bind("<Configure>", self._redraw_app_list) # Resizing reveals or hides rows
+        self.app_list_canvas.bind("<Button-1>", self._on_app_list_clicked)
+        self.app_list_canvas.bind("<MouseWheel>", self._on_app_list_mousewheel) # Windows / macOS
+        self.app_list_canvas.bind("<Button-4>", self._on_app_list_mousewheel) # Linux scroll up
+        self.app_list_canvas.bind("<Button-5>", self._on_app_list_mousewheel) # Linux scroll down
+
+
+    def _build_logcat_tab(self):
+        """Creates the widgets of the Logcat tab (controls and log area)."""
+        self._logcat_built = True
 
         # --- Populate Logcat Tab ---
         self.logcat_tab.grid_columnconfigure(0, weight=1)
@@ -320,65 +556,22 @@ class AdbGripperApp(ctk.CTk):
         # Logcat Text Area
         self.logcat_textbox = ctk.CTkTextbox(self.logcat_tab, activate_scrollbars=True)
         self.logcat_textbox.grid(row=1, column=0, sticky="nsew", padx=10, pady=5)
-        self.logcat_textbox.configure(state="disabled") # Read-only initially
-
+        # The textbox stays in "normal" state, so inserting lines needs no state toggling; it is made
+        # read-only by swallowing editing input instead (selecting and copying still work)
+        for sequence in ("<Key>", "<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>"):
+            self.logcat_textbox.bind(sequence, self._block_logcat_edit)
+        # Warnings and errors are colored through text tags (see _LOGCAT_LEVEL_TAGS)
+        self.logcat_textbox.tag_config("warning", foreground="orange")
+        self.logcat_textbox.tag_config("error", foreground="red")
 
-        # Bottom Frame (Status Bar)
-        # Placed in row 2, spanning both columns. Fixed height.
-        self.status_frame = ctk.CTkFrame(self, height=30, fg_color="gray") # Give it a distinct color for visibility
-        self.status_frame.grid(row=2, column=0, columnspan=2, sticky="nsew", padx=10, pady=5)
-        # Configure grid within status_frame for the label
-        self.status_frame.grid_columnconfigure(0, weight=1)
-        self.status_frame.grid_rowconfigure(0, weight=1)
-
-        # Label to display status messages, anchored to the west (left)
-        self.status_label = ctk.CTkLabel(self.status_frame, text="Initializing...", anchor="w") # Initial status text
-        self.status_label.grid(row=0, column=0, sticky="nsew", padx=5) # 'nsew' makes label fill the status frame
-
-
-        # --- Initial Actions ---
-        # Set Window Icon
-        try:
-            # Handle path for PyInstaller (sys._MEIPASS) or normal run
-            if getattr(sys, 'frozen', False):
-                application_path = sys._MEIPASS
-            else:
-                application_path = os.path.dirname(os.path.abspath(__file__))
-            
-            icon_path = os.path.join(application_path, "mon_icone.ico")
-            
-            if os.path.exists(icon_path):
-                # On Windows, iconbitmap works with .ico
-                # On Linux, it often requires a bitmap or fails with .ico depending on the WM.
-                # We try a generic approach.
-                if sys.platform.startswith("win"):
-                    self.iconbitmap(icon_path)
-                else:
-                    # For Linux/Mac, trying to set the icon. 
-                    # Note: iconbitmap with .ico might fail on some Linux WMs.
-                    # Ideally we would use a png and tk.PhotoImage, but we only have .ico.
-                    # We attempt it, catching errors to avoid crash.
-                    try:
-                        self.wm_iconbitmap(bitmap=f"@{icon_path}")
-                    except Exception:
-                        pass # specific linux icon setting might fail without .xbm or .png
-            
-        except Exception as e:
-            print(f"Warning: Could not set icon: {e}")
 
-        # Automatically list devices on startup if ADB is available
-        if self.adb_manager.adb_available:
-             # Run list_devices_in_gui in a thread on startup to avoid freezing UI
-             threading.Thread(target=self._perform_list_devices_threaded, daemon=True).start()
-        else:
-             # If adb is not available, update GUI elements and status
-             self.device_combobox.set("ADB not found")
-             self.device_combobox.configure(state="disabled")
-             self.refresh_button.configure(state="disabled")
-             self.connect_ip_button.configure(state="disabled")
-             # Functionality tabs/buttons should also be disabled
-             self.enable_functionality_widgets(False)
-             self.update_status("ADB command not found. Please install Android SDK Platform-Tools.", level="error")
+    def on_closing(self):
+        """Cleans up AdbManager resources before closing the main window."""
+        # Queued operations are dropped; running ones end with their adb command's timeout
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        if self.adb_manager is not None: # The window may be closed before _init_adb ran
+            self.adb_manager.close()
+        self.destroy()
 
 
     # --- Status Update Method ---
@@ -386,6 +579,8 @@ class AdbGripperApp(ctk.CTk):
         """
         Method to update the status bar message safely from any thread.
         Uses self.after() to ensure GUI updates happen on the main thread.
+        Bursts of messages are coalesced: at most one update is scheduled per STATUS_FLUSH_DELAY_MS,
+        and it shows the latest message.
         """
         color = "white" # Default text color
         if level == "error":
@@ -393,9 +588,24 @@ class AdbGripperApp(ctk.CTk):
         elif level == "warning":
             color = "yellow" # Or orange
 
-        # Schedule the actual update of the status label on the main thread
+        # Remember the latest message and schedule a single flush on the main thread
         # self.after(delay_ms, callback, *args)
-        self.after(0, lambda msg=message, clr=color: self._do_update_status_gui(msg, clr)) # Using lambda here
+        with self._status_lock:
+            self._pending_status = (message, color)
+            if self._status_scheduled:
+                return # The queued flush will pick up this message
+            self._status_scheduled = True
+        self.after(self.STATUS_FLUSH_DELAY_MS, self._flush_status)
+
+
+    def _flush_status(self):
+        """Shows the latest pending status message (runs on the main thread)."""
+        with self._status_lock:
+            pending = self._pending_status
+            self._pending_status = None
+            self._status_scheduled = False
+        if pending:
+            self._do_update_status_gui(*pending)
 
 
     def _do_update_status_gui(self, message, color):
@@ -409,6 +619,8 @@ class AdbGripperApp(ctk.CTk):
     def enable_functionality_widgets(self, enable):
         """Enables or disables widgets in the functionality tabs based on device connection."""
         state = "normal" if enable else "disabled"
+        # Remembered for the tabs that are built later (see _on_tab_changed)
+        self._functionality_enabled = enable
 
         # Device Control Buttons
         self.reboot_normal_button.configure(state=state)
@@ -416,11 +628,15 @@ class AdbGripperApp(ctk.CTk):
         self.reboot_bootloader_button.configure(state=state)
         self.power_off_button.configure(state=state)
 
+        if not self._app_management_built:
+            return # The App Management widgets do not exist until the tab is first opened
+
         # App Management - Install Section
         self.select_apk_button.configure(state=state)
         # Install button is enabled only if a device is selected AND a file is selected
         # So, we only enable it here if enable is True and a file is already selected (self.selected_apk_path is not None)
-        apk_file_selected = (self.selected_apk_path is not None and os.path.exists(self.selected_apk_path))
+        # The file check was done at selection time, so no disk access happens here
+        apk_file_selected = (self.selected_apk_path is not None and self._apk_path_valid)
         self.install_apk_button.configure(state="normal" if enable and apk_file_selected else "disabled")
 
         # App Management - Uninstall Section Controls
@@ -431,31 +647,50 @@ class AdbGripperApp(ctk.CTk):
 
 
     # --- Device Listing Logic ---
-    def list_devices_in_gui(self):
-        """Calls AdbManager to list devices and updates the GUI dropdown."""
+    def list_devices_in_gui(self, force=False):
+        """
+        Calls AdbManager to list devices and updates the GUI dropdown.
+        Args: force: If True, cached device info is discarded and fetched again from every device.
+        """
         if not self.adb_manager.adb_available:
             return # Do nothing if adb is not found
+        self._last_list_devices_ts = time.monotonic()
+        self._device_listing = True
 
         # Update GUI state immediately to show activity
         self.refresh_button.configure(state="disabled")
         self.device_combobox.set("Searching...")
         self.device_combobox.configure(state="disabled")
         # Clear selected device info temporarily while searching
-        self.selected_device_label.configure(text="Selected Device: Searching...")
+        self.selected_device_var.set("Selected Device: Searching...")
         self.update_device_info(clear_only=True) # Clear info sidebar
 
 
-        # Run the potentially blocking ADB command in a separate thread
-        # daemon=True ensures the thread doesn't prevent the app from closing
-        threading.Thread(target=self._perform_list_devices_threaded, daemon=True).start()
+        # Run the potentially blocking ADB command on the worker pool
+        # (on_closing drops queued jobs; a running one ends with its adb command's timeout)
+        self._pool.submit(self._perform_list_devices_threaded, force)
+
 
+    def _force_refresh_devices(self, event=None):
+        """Handles Shift-click on the Refresh button: refreshes the device list without using cached device info."""
+        if self.refresh_button.cget("state") == "disabled":
+            return # A refresh is already running
+        self.list_devices_in_gui(force=True)
 
-    def _perform_list_devices_threaded(self):
+
+    def _perform_list_devices_threaded(self, force=False):
          """Performs device listing in a thread and updates GUI via self.after."""
          # Blocking call to AdbManager - returns list of device dicts (serial, state, description)
+         if force:
+             self.adb_manager.invalidate_devices_cache()
          devices = self.adb_manager.list_devices()
+         # Keep only the cached info of devices still listed in the same state;
+         # vanished devices and devices whose state changed are fetched again when they come back.
+         current_keys = {(dev['serial'], dev.get('state', '')) for dev in devices}
+         prop_cache = {} if force else {key: props for key, props in self._device_prop_cache.items() if key in current_keys}
          # We need to format the values for the combobox using the serial and state
          device_display_values = []
+         display_to_serial = {}
          # Store the device info for later retrieval by serial
          self.available_devices_info = {} # Dict to map serial -> device dict
 
@@ -470,14 +705,36 @@ class AdbGripperApp(ctk.CTk):
                  display_str = f"{serial} [{state.capitalize()}]"
              # For 'device' state, just show the serial
 
+             # Cached info (if any) is attached right away; missing info is fetched below
+             dev['props'] = prop_cache.get((serial, state))
+
              device_display_values.append(display_str)
+             display_to_serial[display_str] = serial
              self.available_devices_info[serial] = dev # Store the full device info by serial
 
-
          # Use self.after to update GUI elements from the thread safely
-         # Schedule the update on the main GUI thread
+         # The dropdown is shown right away; the selected device fetches its own info if it is not cached yet.
+         self._display_to_serial = display_to_serial
          self.after(0, self._update_device_list_gui, device_display_values)
 
+         # Then prefetch the info of fully connected devices that are not cached yet (only these can answer property queries).
+         # The queries run concurrently on AdbManager's worker pool, so N devices cost about one device's latency.
+         missing = [dev for dev in devices if dev.get('state') == 'device' and dev['props'] is None]
+         if missing:
+             serials = [dev['serial'] for dev in missing]
+             if force:
+                 for serial in serials:
+                     self.adb_manager.invalidate_device_info(serial)
+             for dev, props in zip(missing, self.adb_manager.get_device_info_batch(serials)):
+                 dev['props'] = props
+                 if props:
+                     prop_cache[(dev['serial'], 'device')] = props
+                     self._device_info_ts[dev['serial']] = time.monotonic()
+
+         # Swap in the new cache as a whole, so the GUI thread never sees it half-updated
+         self._device_prop_cache = prop_cache
+         self._device_info_ts = {serial: ts for serial, ts in self._device_info_ts.items() if (serial, 'device') in prop_cache}
+
 
     def _update_device_list_gui(self, device_display_values):
          """Updates the GUI device list dropdown from data fetched in a thread."""
@@ -486,7 +743,7 @@ class AdbGripperApp(ctk.CTk):
              # Select the first device and trigger the selection logic
              # Ensure the value we are setting exists in the list of values
              current_value = self.device_combobox.get()
-             if current_value not in device_display_values or current_value in ["No devices found", "Searching...", "ADB not found"]:
+             if current_value not in device_display_values or current_value in _PLACEHOLDER_ENTRIES:
                   self.device_combobox.set(device_display_values[0])
              # Explicitly call on_device_selected as setting the value doesn't always trigger binding
              # Use self.after(0, ...) to ensure it runs after the combobox values are fully updated
@@ -495,7 +752,7 @@ class AdbGripperApp(ctk.CTk):
              # No devices found
              self.device_combobox.configure(values=["No devices found"], state="disabled")
              self.device_combobox.set("No devices found")
-             self.selected_device_label.configure(text="Selected Device: None")
+             self.selected_device_var.set("Selected Device: None")
              self.current_device_serial = None
              self.update_device_info(clear_only=True) # Clear info sidebar
              self.enable_functionality_widgets(False) # Disable controls
@@ -505,6 +762,12 @@ class AdbGripperApp(ctk.CTk):
          # Re-enable refresh button after command finishes
          self.refresh_button.configure(state="normal")
 
+         # A device change pushed during the listing may not be part of its result: list again if it differs
+         self._device_listing = False
+         pending_states, self._pending_device_states = self._pending_device_states, None
+         if pending_states is not None and pending_states != self._shown_device_states():
+             self.list_devices_in_gui()
+
 
     # --- Device Connection by IP Logic ---
     def connect_device_by_ip(self):
@@ -520,26 +783,52 @@ class AdbGripperApp(ctk.CTk):
         # Update GUI state immediately to show activity
         self.connect_ip_button.configure(state="disabled")
         self.ip_entry.configure(state="disabled")
-        self.selected_device_label.configure(text=f"Selected Device: Connecting to {ip_address}...") # Temporary status
+        self.selected_device_var.set(f"Selected Device: Connecting to {ip_address}...") # Temporary status
         self.update_device_info(clear_only=True) # Clear info sidebar
 
 
         # Run the connection attempt in a separate thread
-        threading.Thread(target=self._perform_connect_ip_threaded, args=(ip_address,), daemon=True).start()
+        self._pool.submit(self._perform_connect_ip_threaded, ip_address)
 
 
     def _perform_connect_ip_threaded(self, ip_address):
         """Performs IP connection in a thread and updates GUI via self.after."""
         # Blocking call to AdbManager
-        success = self.adb_manager.connect_device(ip_address)
+        # connect_device reports the serial adb registered the device under (e.g. with the default
+        # port added), so the device can be added without listing every device again.
+        serial, state = self.adb_manager.connect_device(ip_address)
+        success = serial is not None
+        props = None
+        if state == 'device':
+            # The device is ready, so its info (one batched shell round-trip) is fetched right away.
+            # Any other state (e.g. unauthorized) was already reported by connect_device; a fetch
+            # would only fail and bury that status under errors.
+            props = self.adb_manager.get_device_info(serial)
         # Schedule handling the result on the main GUI thread
-        self.after(0, lambda s=success, addr=ip_address: self._handle_connect_result_gui(s, attempted_address=addr)) # Using lambda here
+        self.after(0, self._handle_connect_result_gui, success, ip_address, serial, state, props)
 
 
-    def _handle_connect_result_gui(self, success, attempted_address):
+    def _handle_connect_result_gui(self, success, attempted_address, serial=None, state=None, props=None):
         """Handles the result of a connection attempt and updates GUI."""
-        if success:
-            # If connect command succeeded, refresh the device list to see the new connection
+        if success and serial and state == 'device':
+            # The new device is ready: add it to the dropdown directly and select it
+            # Prefetched info is cached, so selecting the device renders it without another fetch
+            self.available_devices_info[serial] = {'serial': serial, 'state': state, 'description': '', 'props': props}
+            if props:
+                self._device_prop_cache[(serial, state)] = props
+                self._device_info_ts[serial] = time.monotonic()
+            device_display_values = [value for value in self.device_combobox.cget("values")
+                                     if value not in _PLACEHOLDER_ENTRIES]
+            if serial not in device_display_values:
+                device_display_values.append(serial)
+            self._display_to_serial[serial] = serial
+            self.device_combobox.configure(values=device_display_values, state="normal")
+            self.device_combobox.set(serial)
+            self.on_device_selected()
+            # Status update already handled by AdbManager callback
+        elif success:
+            # Connected but not ready (e.g. unauthorized, already reported by connect_device),
+            # so refresh the device list to show the new connection in its current state
             # This is important for ADB to fully register the connection.
             # list_devices_in_gui is also threaded internally, so it's safe to call here.
             self.list_devices_in_gui()
@@ -548,7 +837,7 @@ class AdbGripperApp(ctk.CTk):
              # If connection failed, update status (already done by AdbManager)
              # Clear selected device info as connection failed
              # Use the attempted address in the label
-             self.selected_device_label.configure(text=f"Selected Device: Connection to {attempted_address} failed.")
+             self.selected_device_var.set(f"Selected Device: Connection to {attempted_address} failed.")
              self.update_device_info(clear_only=True) # Clear info sidebar
              self.enable_functionality_widgets(False) # Disable controls
 
@@ -562,59 +851,94 @@ class AdbGripperApp(ctk.CTk):
     def on_device_selected(self, event=None):
         """Handles when a device is selected from the dropdown."""
         selected_item_text = self.device_combobox.get()
-        # Parse the serial number from the displayed text (assuming "Serial (Description)" format or just "Serial")
-        # Find the first space or parenthesis to extract the serial
-        serial = selected_item_text.split(' ')[0].split('(')[0].strip()
+        # Entries built from the device list map straight to their serial
+        serial = self._display_to_serial.get(selected_item_text)
+        if serial is None:
+            # Unknown text (e.g. typed in): parse the serial from it (assuming "Serial (Description)" format or just "Serial")
+            # Everything before the first space or parenthesis is the serial
+            serial = selected_item_text.strip().partition(' ')[0].partition('(')[0]
 
 
         # Only update if a valid serial is selected (not the placeholder/error text)
-        if serial and serial not in ["No", "ADB", "Selected", "Searching..."]: # Simple check against placeholder text parts
+        if serial and serial not in _PLACEHOLDER_TOKENS: # Simple check against placeholder text parts
              # Also check if this serial is actually in our list of available devices (important after refresh)
              if serial in self.available_devices_info:
+                self._release_previous_shell(serial)
                 self.current_device_serial = serial
                 # Update device info panel - This call will trigger a threaded fetch
                 # The selected_device_label will be updated *after* fetch is complete in _do_update_device_info_gui
-                self.selected_device_label.configure(text=f"Selected Device: {serial} (Fetching info...)") # Temporary status
+                self.selected_device_var.set(f"Selected Device: {serial} (Fetching info...)") # Temporary status
                 self.update_device_info() # This triggers the fetch
                 # Enable functionality widgets now that a device is selected
                 self.enable_functionality_widgets(True)
-                # Also load the app list when a device is selected
-                self.list_apps_in_gui()
+                # Also load the app list when a device is selected (once the App Management tab exists)
+                if self._app_management_built:
+                    self.list_apps_in_gui(use_cache=True)
 
              else:
-                  # The selected serial is no longer in the available devices list (e.g., unplugged)
-                  # This case should ideally be handled by list_devices_in_gui refreshing automatically
-                  # after a disconnection, but adding a fallback refresh here just in case.
-                  self.update_status(f"Selected device {serial} is no longer available. Refreshing list.", level="warning")
-                  self.list_devices_in_gui() # Refresh the list to update the dropdown
+                  # The selected serial is no longer in the available devices list (e.g., unplugged).
+                  # We already know it is gone, so drop the selection locally.
+                  self._release_previous_shell(None)
+                  self.current_device_serial = None
+                  self.selected_device_var.set("Selected Device: None")
+                  self.update_device_info(clear_only=True) # Clear info display
+                  self.enable_functionality_widgets(False) # Disable controls
+                  # Device tracking normally refreshes the list after a disconnection; this fallback refresh
+                  # is throttled so repeated clicks on a gone device don't start one listing each
+                  if time.monotonic() - self._last_list_devices_ts > self.STALE_REFRESH_INTERVAL:
+                      self.update_status(f"Selected device {serial} is no longer available. Refreshing list.", level="warning")
+                      self.list_devices_in_gui() # Refresh the list to update the dropdown
+                  else:
+                      self.update_status(f"Selected device {serial} is no longer available.", level="warning")
         else:
              # No valid device selected (placeholder text)
+             self._release_previous_shell(None)
              self.current_device_serial = None
-             self.selected_device_label.configure(text="Selected Device: None")
+             self.selected_device_var.set("Selected Device: None")
              self.update_device_info(clear_only=True) # Clear info display
              self.enable_functionality_widgets(False) # Disable controls
 
 
+    def _release_previous_shell(self, new_serial):
+        """
+        Closes the persistent adb shell of the previously selected device when the selection moves away from it.
+        Args: new_serial: The serial being selected (None if no device).
+        """
+        previous_serial = self.current_device_serial
+        if previous_serial and previous_serial != new_serial and self.adb_manager:
+            # close_shell waits for a command still running in that shell, so keep it off the GUI thread
+            self._pool.submit(self.adb_manager.close_shell, previous_serial)
+
+
     def update_device_info(self, clear_only=False):
         """
         Updates the device information labels based on the current_device_serial.
         Args: clear_only: If True, only clears the labels.
         """
         # Clear previous info display immediately
-        self.serial_display_label.configure(text="Serial: N/A")
-        self.model_label.configure(text="Model: N/A")
-        self.commercial_name_label.configure(text="Commercial Name: N/A") # Clear commercial name
-        self.android_version_label.configure(text="Android Version: N/A")
-        self.battery_level_label.configure(text="Battery Level: N/A") # Clear battery level
+        self.serial_var.set("Serial: N/A")
+        self.model_var.set("Model: N/A")
+        self.commercial_name_var.set("Commercial Name: N/A") # Clear commercial name
+        self.android_version_var.set("Android Version: N/A")
+        self.battery_level_var.set("Battery Level: N/A") # Clear battery level
 
 
         if not clear_only and self.current_device_serial and self.adb_manager.adb_available:
              # Update the serial display label immediately as we know the serial
              # The main selected_device_label is updated temporarily in on_device_selected
-             self.serial_display_label.configure(text=f"Serial: {self.current_device_serial}")
+             self.serial_var.set(f"Serial: {self.current_device_serial}")
+
+             # Info fetched during the last refresh is shown directly, without another ADB round-trip
+             cached_props = self.available_devices_info.get(self.current_device_serial, {}).get('props')
+             if cached_props:
+                 self._do_update_device_info_gui(cached_props)
+                 if time.monotonic() - self._device_info_ts.get(self.current_device_serial, 0.0) < self.DEVICE_INFO_TTL:
+                     return
+                 # Too old for the battery level: refetch in the background. Model, version and name are
+                 # cached by AdbManager, so this only reads 'dumpsys battery'.
 
              # Run fetching device info in a separate thread to keep GUI responsive
-             threading.Thread(target=self._fetch_and_update_device_info_threaded, args=(self.current_device_serial,), daemon=True).start()
+             self._pool.submit(self._fetch_and_update_device_info_threaded, self.current_device_serial)
         # else: clear_only was True, or current_device_serial is None, labels are already N/A
 
 
@@ -624,8 +948,17 @@ class AdbGripperApp(ctk.CTk):
          # This will return the info dictionary including display_name and battery_level
          info = self.adb_manager.get_device_info(serial)
 
+         device = self.available_devices_info.get(serial)
+         if info and device is not None and device.get('state') == 'device':
+             # Keep the fresh info for the next selection (see DEVICE_INFO_TTL)
+             device['props'] = info
+             self._device_prop_cache[(serial, 'device')] = info
+             self._device_info_ts[serial] = time.monotonic()
+         elif not info and device is not None and device.get('props'):
+             return # A failed refetch keeps the cached info on screen
+
          # Schedule safely updating GUI elements from the thread
-         self.after(0, lambda info_data=info: self._do_update_device_info_gui(info_data)) # Using lambda here
+         self.after(0, self._do_update_device_info_gui, info)
 
 
     def _do_update_device_info_gui(self, info):
@@ -642,11 +975,11 @@ class AdbGripperApp(ctk.CTk):
 
 
          # --- Update Device Info sidebar labels ---
-         self.serial_display_label.configure(text=f"Serial: {serial}")
-         self.model_label.configure(text=f"Model: {model}")
-         self.commercial_name_label.configure(text=f"Commercial Name: {display_name}") # Update commercial name label
-         self.android_version_label.configure(text=f"Android Version: {version}")
-         self.battery_level_label.configure(text=f"Battery Level: {battery_level}") # Update battery level label
+         self.serial_var.set(f"Serial: {serial}")
+         self.model_var.set(f"Model: {model}")
+         self.commercial_name_var.set(f"Commercial Name: {display_name}") # Update commercial name label
+         self.android_version_var.set(f"Android Version: {version}")
+         self.battery_level_var.set(f"Battery Level: {battery_level}") # Update battery level label
 
 
          # --- Update the 'Selected Device' label in the connection area ---
@@ -655,53 +988,47 @@ class AdbGripperApp(ctk.CTk):
          text_to_display = "Selected Device: None" # Default text if no valid info found
 
          # Use the determined display_name for the main label
-         if display_name and display_name not in ['N/A', 'Error']:
+         if display_name and display_name not in _INVALID_INFO:
              # Include model and serial in parentheses if display_name is available
              # Format: "Selected Device: Commercial Name (Model) (Serial)"
              text_to_display = f"Selected Device: {display_name} ({model}) ({serial})"
-         elif model and model not in ['N/A', 'Error']:
+         elif model and model not in _INVALID_INFO:
              # Fallback to Model (Serial) if no valid display_name
              text_to_display = f"Selected Device: {model} ({serial})"
-         elif serial and serial not in ['N/A', 'Error']:
+         elif serial and serial not in _INVALID_INFO:
              # Fallback to just serial if neither display_name nor model is valid
              text_to_display = f"Selected Device: {serial}"
          # Else: keep default "Selected Device: None"
 
 
          # Effective update of the label
-         self.selected_device_label.configure(text=text_to_display)
+         self.selected_device_var.set(text_to_display)
 
 
     # --- Device Control Methods ---
 
+    @_require_device
     def reboot_normal(self):
         """Initiates a normal device reboot in a separate thread."""
-        if self.current_device_serial and self.adb_manager.adb_available:
-            # Disable buttons temporarily to prevent multiple clicks
-            self.enable_functionality_widgets(False)
-            self.update_status("Initiating normal reboot...", level="info")
-            # Run the reboot command in a separate thread
-            threading.Thread(target=self._perform_reboot_threaded, args=(self.current_device_serial, ""), daemon=True).start()
-        else:
-             self.update_status("No device selected or ADB not available.", level="warning")
+        # Disable buttons temporarily to prevent multiple clicks
+        self.enable_functionality_widgets(False)
+        self.update_status("Initiating normal reboot...", level="info")
+        # Run the reboot command in a separate thread
+        self._pool.submit(self._perform_reboot_threaded, self.current_device_serial, "")
 
+    @_require_device
     def reboot_recovery(self):
         """Initiates a reboot to recovery in a separate thread."""
-        if self.current_device_serial and self.adb_manager.adb_available:
-            self.enable_functionality_widgets(False)
-            self.update_status("Initiating reboot to recovery...", level="info")
-            threading.Thread(target=self._perform_reboot_threaded, args=(self.current_device_serial, "recovery"), daemon=True).start()
-        else:
-             self.update_status("No device selected or ADB not available.", level="warning")
+        self.enable_functionality_widgets(False)
+        self.update_status("Initiating reboot to recovery...", level="info")
+        self._pool.submit(self._perform_reboot_threaded, self.current_device_serial, "recovery")
 
+    @_require_device
     def reboot_bootloader(self):
         """Initiates a reboot to bootloader in a separate thread."""
-        if self.current_device_serial and self.adb_manager.adb_available:
-            self.enable_functionality_widgets(False)
-            self.update_status("Initiating reboot to bootloader...", level="info")
-            threading.Thread(target=self._perform_reboot_threaded, args=(self.current_device_serial, "bootloader"), daemon=True).start()
-        else:
-             self.update_status("No device selected or ADB not available.", level="warning")
+        self.enable_functionality_widgets(False)
+        self.update_status("Initiating reboot to bootloader...", level="info")
+        self._pool.submit(self._perform_reboot_threaded, self.current_device_serial, "bootloader")
 
     def _perform_reboot_threaded(self, serial, mode):
         """Performs the reboot command in a thread and handles potential disconnection."""
@@ -714,22 +1041,20 @@ class AdbGripperApp(ctk.CTk):
             # Use self.after to schedule list_devices_in_gui (which is itself threaded)
             self.after(5000, self.list_devices_in_gui) # Refresh after 5 seconds
         else:
-             # If the command failed to send, re-enable widgets immediately
-             self.after(0, lambda: self.enable_functionality_widgets(True)) # Re-enable via lambda
+             # If the command failed to send, re-enable widgets immediately (if the device is still selected)
+             self.after(0, self._reenable_after_device_command, serial)
 
 
         # AdbManager callback handles status updates (success or failure)
 
 
+    @_require_device
     def power_off(self):
         """Initiates device power off in a separate thread."""
-        if self.current_device_serial and self.adb_manager.adb_available:
-             self.enable_functionality_widgets(False)
-             self.update_status("Initiating power off...", level="info")
-             # Run the power off command in a separate thread
-             threading.Thread(target=self._perform_power_off_threaded, args=(self.current_device_serial,), daemon=True).start()
-        else:
-             self.update_status("No device selected or ADB not available.", level="warning")
+        self.enable_functionality_widgets(False)
+        self.update_status("Initiating power off...", level="info")
+        # Run the power off command in a separate thread
+        self._pool.submit(self._perform_power_off_threaded, self.current_device_serial)
 
     def _perform_power_off_threaded(self, serial):
         """Performs the power off command in a thread and handles potential disconnection."""
@@ -741,12 +1066,22 @@ class AdbGripperApp(ctk.CTk):
         if success:
              self.after(2000, self.list_devices_in_gui) # Refresh after 2 seconds
         else:
-            # If the command failed to send, re-enable widgets immediately
-             self.after(0, lambda: self.enable_functionality_widgets(True)) # Re-enable via lambda
+            # If the command failed to send, re-enable widgets immediately (if the device is still selected)
+             self.after(0, self._reenable_after_device_command, serial)
 
         # AdbManager callback handles status updates (success or failure)
 
 
+    def _reenable_after_device_command(self, serial):
+        """
+        Re-enables the device controls after a failed reboot/power off, on the main GUI thread.
+        Args: serial: The device the command was sent to.
+        """
+        # The user may have selected another device (or none) meanwhile; its controls are managed by on_device_selected
+        if serial == self.current_device_serial:
+            self.enable_functionality_widgets(True)
+
+
     # --- App Management - Install Methods ---
 
     def select_apk_file(self):
@@ -759,6 +1094,13 @@ class AdbGripperApp(ctk.CTk):
         if apk_path:
             # Store the selected path in an instance variable
             self.selected_apk_path = apk_path
+            # The file is stat'ed once here; the install thread checks it again, so the GUI thread never waits on the disk later
+            try:
+                self._apk_mtime = os.path.getmtime(apk_path)
+                self._apk_path_valid = os.path.isfile(apk_path)
+            except OSError:
+                self._apk_mtime = None
+                self._apk_path_valid = False
             # Update the label text to show just the filename for brevity
             self.apk_path_label.configure(text=os.path.basename(apk_path))
             # Enable the install button if a device is also selected and adb is available
@@ -767,21 +1109,23 @@ class AdbGripperApp(ctk.CTk):
         else:
             # If dialog is cancelled or no file selected, clear the path and disable install button
             self.selected_apk_path = None
+            self._apk_path_valid = False
+            self._apk_mtime = None
             self.apk_path_label.configure(text="No file selected")
             self.install_apk_button.configure(state="disabled")
 
 
+    @_require_device
     def install_selected_apk(self):
         """Calls AdbManager to install the selected APK in a separate thread."""
-        if not self.current_device_serial or not self.adb_manager.adb_available:
-             self.update_status("No device selected or ADB not available.", level="warning")
-             return
-
-        # Check if an APK file path is stored and the file exists
-        if not self.selected_apk_path or not os.path.exists(self.selected_apk_path):
+        # Check if an APK file path is stored and the file existed when it was selected
+        # (the install thread makes sure it is still there and unchanged)
+        if not self.selected_apk_path or not self._apk_path_valid:
              self.update_status("No valid APK file selected or file not found.", level="warning")
              # Clear the invalid path display
              self.selected_apk_path = None
+             self._apk_path_valid = False
+             self._apk_mtime = None
              self.apk_path_label.configure(text="No file selected")
              self.install_apk_button.configure(state="disabled")
              return
@@ -792,43 +1136,80 @@ class AdbGripperApp(ctk.CTk):
         # Note: Other functionality widgets are already enabled if we reach here.
 
 
-        # Run the installation command in a separate thread
-        # Using daemon=True allows the thread to close automatically when the main app exits
+        # Run the installation command on the worker pool
+        # (on_closing drops queued jobs; a running install ends with its adb command's timeout)
         self.update_status(f"Starting installation of {os.path.basename(self.selected_apk_path)}...", level="info")
-        threading.Thread(target=self._perform_install_apk_threaded, args=(self.current_device_serial, self.selected_apk_path), daemon=True).start()
+        self._pool.submit(self._perform_install_apk_threaded, self.current_device_serial, self.selected_apk_path, self._apk_mtime)
 
 
-    def _perform_install_apk_threaded(self, serial, apk_path):
-        """Performs the APK installation command in a thread."""
+    def _perform_install_apk_threaded(self, serial, apk_path, apk_mtime):
+        """
+        Performs the APK installation command in a thread.
+        Args: serial: The target device.
+              apk_path: The APK file to install.
+              apk_mtime: The file's modification time when it was selected.
+        """
+        # Make sure the file is still the one that was selected before handing it to adb
+        try:
+            current_mtime = os.path.getmtime(apk_path)
+        except OSError:
+            current_mtime = None
+        if current_mtime is None or current_mtime != apk_mtime:
+            self.after(0, self._handle_apk_changed_gui, serial, apk_path, current_mtime is None)
+            return
+
         # Blocking call to AdbManager
         success = self.adb_manager.install_apk(serial, apk_path)
+        if success:
+            self._invalidate_app_list_cache(serial) # The new app belongs in the lists
 
         # Schedule re-enabling buttons on the main GUI thread
         # The AdbManager callback already updates the status bar with the final outcome.
-        self.after(0, lambda: self._enable_install_buttons_gui()) # Schedule via lambda
+        self.after(0, self._enable_install_buttons_gui, serial, apk_path)
 
 
-    def _enable_install_buttons_gui(self):
-        """Re-enables install buttons on the main GUI thread after installation attempt."""
+    def _enable_install_buttons_gui(self, serial, apk_path):
+        """
+        Re-enables install buttons on the main GUI thread after installation attempt.
+        Args: serial: The device the APK was installed on.
+              apk_path: The APK file that was installed.
+        """
         # Always re-enable the browse button
         self.select_apk_button.configure(state="normal")
 
-        # Re-enable the install button only if a device is still selected AND an APK file is still selected
-        # and the file still exists.
-        if self.current_device_serial and self.selected_apk_path and self.adb_manager.adb_available:
-             if os.path.exists(self.selected_apk_path):
-                self.install_apk_button.configure(state="normal")
-             else:
-                 # If the file disappeared, update the GUI to reflect this
-                 self.selected_apk_path = None
-                 self.apk_path_label.configure(text="File not found")
-                 self.update_status("Selected APK file not found during re-enable check.", level="error")
-                 self.install_apk_button.configure(state="disabled") # Explicitly disable if file gone
+        # Re-enable the install button only if the same device is still selected AND the same APK file
+        # is still selected and the file still exists. If the user switched devices mid-install it stays disabled.
+        # The file is not stat'ed again here: the install thread reports a missing or modified file itself.
+        if serial == self.current_device_serial and apk_path == self.selected_apk_path and self._apk_path_valid and self.adb_manager.adb_available:
+             self.install_apk_button.configure(state="normal")
         else:
              # If device/adb is gone or no file selected, ensure install button is disabled
              self.install_apk_button.configure(state="disabled")
 
 
+    def _handle_apk_changed_gui(self, serial, apk_path, missing):
+        """
+        Handles an APK file that disappeared or was modified since it was selected, on the main GUI thread.
+        Args: serial: The device the install was meant for.
+              apk_path: The APK file.
+              missing: True if the file no longer exists, False if it was modified.
+        """
+        if missing:
+            self.update_status(f"Selected APK file not found: {os.path.basename(apk_path)}", level="error")
+            if apk_path == self.selected_apk_path:
+                # Update the GUI to reflect the file is gone
+                self.selected_apk_path = None
+                self._apk_path_valid = False
+                self._apk_mtime = None
+                self.apk_path_label.configure(text="File not found")
+        else:
+            self.update_status(f"{os.path.basename(apk_path)} was modified since it was selected. Please select it again.", level="warning")
+            if apk_path == self.selected_apk_path:
+                # Only a fresh selection installs the new content
+                self._apk_path_valid = False
+        self._enable_install_buttons_gui(serial, apk_path)
+
+
     # --- App Management - Uninstall Methods ---
 
     def on_app_filter_change(self, selected_filter):
@@ -845,100 +1226,220 @@ class AdbGripperApp(ctk.CTk):
                  text_color="orange"
              )
 
-        # Trigger listing apps with the new filter setting
+        # Trigger listing apps with the new filter setting, once the filter stops changing
         # This should happen when the filter changes, if a device is selected
-        if self.current_device_serial and self.adb_manager.adb_available:
-             self.list_apps_in_gui() # Call this method to refresh the list with the new filter
+        if self._list_apps_after_id is not None:
+            self.after_cancel(self._list_apps_after_id)
+        self._list_apps_after_id = self.after(self.APP_FILTER_DEBOUNCE_MS, self._list_apps_after_filter_change)
 
-    def list_apps_in_gui(self):
-        """Calls AdbManager to list packages and updates the GUI list."""
-        if not self.current_device_serial or not self.adb_manager.adb_available:
-             self.update_status("No device selected or ADB not available to list apps.", level="warning")
-             return
 
-        # Determine filter based on segmented button selection
+    def _list_apps_after_filter_change(self):
+        """Refreshes the app list with the current filter (debounced from on_app_filter_change)."""
+        self._list_apps_after_id = None
+        if self.current_device_serial and self.adb_manager.adb_available:
+             self.list_apps_in_gui(use_cache=True) # Call this method to refresh the list with the new filter
+
+    @_require_device
+    def list_apps_in_gui(self, use_cache=False):
+        """
+        Calls AdbManager to list packages and updates the GUI list.
+        Args: use_cache: If True, a package set already listed for this device and filter is shown without asking the device.
+        """
+        # Determine filter based on segmented button selection. The filter is applied on the device
+        # ('pm list packages -3' for user apps), so system packages are never transferred just to be dropped
         user_only = (self.app_filter_button.get() == "User Apps")
 
+        if use_cache:
+            cached_packages = self._app_list_cache.get((self.current_device_serial, user_only))
+            if cached_packages is not None:
+                self._update_app_list_gui(cached_packages, self.current_device_serial, user_only)
+                return
+
         self.update_status(f"Listing {'user' if user_only else 'all'} apps...", level="info")
 
         # Disable refresh/uninstall buttons while listing
         self.refresh_app_list_button.configure(state="disabled")
         self.uninstall_selected_button.configure(state="disabled")
 
-        # Clear the existing app list display widgets
-        for widget in self.app_list_scrollable_frame.winfo_children():
-            widget.destroy()
-        self.app_checkboxes = {} # Clear the dictionary of checkbox references
-        self.current_app_packages = [] # Clear the list of current packages
+        # Clear the existing app list display if it shows another device; for the same device
+        # the rows (and selection) stay until the new listing arrives, see _update_app_list_gui
+        if self._app_list_serial != self.current_device_serial:
+            self.current_app_packages = () # Clear the current packages
+            self._app_list_serial = None
+            self._set_app_list_rows([])
 
 
         # Use a thread to call AdbManager.list_packages (blocking call)
-        threading.Thread(target=self._perform_list_apps_threaded, args=(self.current_device_serial, user_only), daemon=True).start()
+        self._pool.submit(self._perform_list_apps_threaded, self.current_device_serial, user_only)
 
 
     def _perform_list_apps_threaded(self, serial, user_only):
         """Performs the app listing command in a thread and updates GUI via self.after."""
-        # Blocking call to AdbManager
-        packages = self.adb_manager.list_packages(serial, user_only)
+        # Blocking call to AdbManager; sorted alphabetically here, off the GUI thread, for easier navigation
+        packages = tuple(sorted(self.adb_manager.list_packages(serial, user_only)))
+        # An empty set may be an error, so only actual listings are cached
+        if packages:
+            self._app_list_cache[(serial, user_only)] = packages
 
         # Schedule updating the GUI list on the main GUI thread
-        self.after(0, lambda pkg_list=packages: self._update_app_list_gui(pkg_list)) # Using lambda here
+        self.after(0, self._update_app_list_gui, packages, serial, user_only)
 
 
-    def _update_app_list_gui(self, packages):
-        """Populates the scrollable frame with the list of packages and checkboxes."""
-        self.current_app_packages = packages # Store the list of packages currently displayed
-        self.app_checkboxes = {} # Prepare to store checkbox references
+    def _invalidate_app_list_cache(self, serial):
+        """Forgets the cached package sets (both filters) of a device."""
+        for user_only in (True, False):
+            self._app_list_cache.pop((serial, user_only), None)
 
-        # Clear previous grid configuration inside the scrollable frame
-        # Need to ensure all previous rows are cleared before re-gridding
-        # This is done by destroying widgets above, but explicit row configure reset is good practice
-        # for i in range(self.app_list_scrollable_frame.grid_size()[1]): # Can get max row index
-        #      self.app_list_scrollable_frame.grid_rowconfigure(i, weight=0)
 
+    def _update_app_list_gui(self, packages, serial, user_only):
+        """
+        Populates the app list canvas with the list of packages.
+        Args: packages: The listed package names, sorted (tuple).
+              serial: The device the packages were listed from.
+              user_only: The filter the packages were listed with.
+        """
+        # A listing that finishes after the user switched devices (or filters) must not fill the list:
+        # its package names would be uninstalled from the device now selected. It is only kept in the cache.
+        if serial != self.current_device_serial or user_only != (self.app_filter_button.get() == "User Apps"):
+            return
 
-        if not packages:
-            ctk.CTkLabel(self.app_list_scrollable_frame, text="No applications found matching the filter.").grid(row=0, column=0, padx=10, pady=10, sticky="w", columnspan=2) # Span two columns if no apps
-            # Ensure column weights are set for the "No apps found" label
-            self.app_list_scrollable_frame.grid_columnconfigure(0, weight=1)
-            self.app_list_scrollable_frame.grid_columnconfigure(1, weight=0) # Ensure column 1 doesn't take space
+        same_device = (serial == self._app_list_serial)
+        # Both tuples are sorted, so they are equal exactly when the package sets are
+        if same_device and packages == self.current_app_packages and not any(self._pkg_results):
+            # Nothing changed: rows, selection and scroll position stay as they are
+            pass
+        else:
+            # Selections survive a relist of the same device for packages that are still there
+            selected = self._selected_packages if same_device else ()
+            self._set_app_list_rows(packages, empty_text="No applications found matching the filter.",
+                                    selected=selected, keep_position=same_device)
 
+        self.current_app_packages = packages # Store the packages currently displayed
+        self._app_list_serial = serial
 
-        else:
-            # Configure the grid inside the scrollable frame for app entries (Checkbox + Label)
-            self.app_list_scrollable_frame.grid_columnconfigure(0, weight=0) # Checkbox column (fixed width)
-            self.app_list_scrollable_frame.grid_columnconfigure(1, weight=1) # Label column (takes space)
+        # Re-enable refresh button
+        self.refresh_app_list_button.configure(state="normal")
 
-            # Sort packages alphabetically for easier navigation
-            packages.sort()
+        # Re-evaluate uninstall button state based on selections
+        self._on_app_checkbox_changed() # Call this to update uninstall button state
 
-            for i, package_name in enumerate(packages):
-                # Create a checkbox for the app
-                checkbox = ctk.CTkCheckBox(self.app_list_scrollable_frame, text=package_name, command=self._on_app_checkbox_changed)
-                checkbox.grid(row=i, column=0, padx=(10, 5), pady=2, sticky="w") # Align checkbox to the left
 
-                # Store checkbox reference
-                self.app_checkboxes[package_name] = checkbox
+    # --- Virtualized App List ---
+    def _set_app_list_rows(self, package_names, empty_text=None, selected=(), keep_position=False):
+        """
+        Replaces the rows of the app list canvas.
+        Args: package_names: The package names in display order.
+              empty_text: Message drawn instead of rows when package_names is empty (None draws nothing).
+              selected: Package names to show as selected (others are not).
+              keep_position: If True, the list keeps its scroll position instead of returning to the top.
+        """
+        self._pkg_names = list(package_names)
+        self._pkg_results = [None] * len(self._pkg_names)
+        self._pkg_index = {name: i for i, name in enumerate(self._pkg_names)}
+        self._selected_packages = {name for name in selected if name in self._pkg_index}
+        self._app_list_empty_text = empty_text
+
+        # The scroll region covers every row, even though only the visible ones are drawn
+        top = self.app_list_canvas.yview()[0] if keep_position else 0
+        self.app_list_canvas.configure(scrollregion=(0, 0, 0, len(self._pkg_names) * self.APP_ROW_HEIGHT))
+        self.app_list_canvas.yview_moveto(top)
+        self._redraw_app_list()
+
+
+    def _theme_color(self, widget_name, key):
+        """Returns a customtkinter theme color for the current appearance mode (themes store (light, dark) pairs)."""
+        color = ctk.ThemeManager.theme[widget_name][key]
+        if isinstance(color, (list, tuple)):
+            return color[1] if ctk.get_appearance_mode() == "Dark" else color[0]
+        return color
+
+
+    def _redraw_app_list(self, event=None):
+        """Draws the rows currently visible in the app list canvas, dropping all others."""
+        canvas = self.app_list_canvas
+        canvas.configure(bg=self._theme_color("CTkFrame", "fg_color"))
+        canvas.delete("row")
+
+        if not self._pkg_names:
+            if self._app_list_empty_text:
+                canvas.create_text(10, 10, text=self._app_list_empty_text, anchor="nw", font=self.app_list_font,
+                                   fill=self._theme_color("CTkLabel", "text_color"), tags=("row",))
+            return
 
-                # Optional: Add a label next to the checkbox if desired (e.g., for friendly name if implemented)
-                # label = ctk.CTkLabel(self.app_list_scrollable_frame, text=package_name, anchor="w")
-                # label.grid(row=i, column=1, padx=(0, 10), pady=2, sticky="ew")
+        for i in self._visible_app_rows():
+            self._draw_app_row(i)
 
-            # Ensure the last row has weight 1 to push content up, if needed (often handled by scrollable frame itself)
-            # self.app_list_scrollable_frame.grid_rowconfigure(len(packages), weight=1)
 
+    def _visible_app_rows(self):
+        """Returns the range of app list rows visible from the current scroll offset and canvas height."""
+        canvas = self.app_list_canvas
+        top = canvas.canvasy(0)
+        first = max(0, int(top // self.APP_ROW_HEIGHT))
+        last = min(len(self._pkg_names), int((top + canvas.winfo_height()) // self.APP_ROW_HEIGHT) + 1)
+        return range(first, last)
 
-        # Re-enable refresh button
-        self.refresh_app_list_button.configure(state="normal")
 
-        # Re-evaluate uninstall button state based on selections (currently none after refresh)
-        self._on_app_checkbox_changed() # Call this to update uninstall button state
+    def _draw_app_row(self, i):
+        """Draws (or redraws) one row of the app list: a checkbox square and the package name."""
+        canvas = self.app_list_canvas
+        tag = f"row_{i}"
+        canvas.delete(tag)
+
+        y = i * self.APP_ROW_HEIGHT
+        box_top = y + (self.APP_ROW_HEIGHT - 18) // 2
+        result = self._pkg_results[i]
+        tags = ("row", tag)
+
+        if self._pkg_names[i] in self._selected_packages:
+            checkbox_color = self._theme_color("CTkCheckBox", "fg_color")
+            canvas.create_rectangle(10, box_top, 28, box_top + 18, fill=checkbox_color, outline=checkbox_color, width=2, tags=tags)
+            canvas.create_line(14, box_top + 9, 18, box_top + 13, 24, box_top + 5,
+                               fill=self._theme_color("CTkCheckBox", "checkmark_color"), width=2, tags=tags)
+        else:
+            canvas.create_rectangle(10, box_top, 28, box_top + 18, outline=self._theme_color("CTkCheckBox", "border_color"), width=2, tags=tags)
+
+        # Processed packages show their uninstall result and can no longer be selected
+        if result is None:
+            text = self._pkg_names[i]
+            text_color = self._theme_color("CTkCheckBox", "text_color")
+        else:
+            text = f"{self._pkg_names[i]} ({self.APP_RESULT_LABELS[result]})"
+            text_color = self.APP_RESULT_COLORS[result]
+        canvas.create_text(36, y + self.APP_ROW_HEIGHT // 2, text=text, anchor="w", font=self.app_list_font, fill=text_color, tags=tags)
+
+
+    def _on_app_list_scrolled(self, first, last):
+        """yscrollcommand of the app list canvas: moves the scrollbar and draws the newly visible rows."""
+        self.app_list_scrollbar.set(first, last)
+        self._redraw_app_list()
+
+
+    def _on_app_list_mousewheel(self, event):
+        """Scrolls the app list with the mouse wheel (event.delta on Windows/macOS, buttons 4/5 on Linux)."""
+        if event.num == 4 or event.delta > 0:
+            self.app_list_canvas.yview_scroll(-1 if sys.platform == "darwin" else -3, "units")
+        elif event.num == 5 or event.delta < 0:
+            self.app_list_canvas.yview_scroll(1 if sys.platform == "darwin" else 3, "units")
+
+
+    def _on_app_list_clicked(self, event):
+        """Toggles the selection of the clicked app list row."""
+        i = int(self.app_list_canvas.canvasy(event.y) // self.APP_ROW_HEIGHT)
+        if not 0 <= i < len(self._pkg_names) or self._pkg_results[i] is not None:
+            return # Click below the last row, or on an already processed package
+        package_name = self._pkg_names[i]
+        if package_name in self._selected_packages:
+            self._selected_packages.discard(package_name)
+        else:
+            self._selected_packages.add(package_name)
+        self._draw_app_row(i)
+        self._on_app_checkbox_changed()
 
 
     def _on_app_checkbox_changed(self):
         """Checks if any app checkbox is selected and updates the Uninstall and Details button states."""
-        selected_count = sum(1 for checkbox in self.app_checkboxes.values() if checkbox.get() == 1)
-        
+        selected_count = len(self._selected_packages)
+
         self.uninstall_selected_button.configure(state="normal" if selected_count > 0 else "disabled")
         # Enable Details button only if exactly one app is selected
         self.view_details_button.configure(state="normal" if selected_count == 1 else "disabled")
@@ -946,11 +1447,8 @@ class AdbGripperApp(ctk.CTk):
 
     def uninstall_selected_apps(self):
         """Handles confirmation and uninstallation/disabling of selected apps."""
-        # Get list of selected package names
-        selected_packages = [
-            package_name for package_name, checkbox in self.app_checkboxes.items()
-            if checkbox.get() == 1
-        ]
+        # Get list of selected package names (sorted, like the rows)
+        selected_packages = sorted(self._selected_packages)
 
         if not selected_packages:
             self.update_status("No applications selected for uninstall.", level="warning")
@@ -963,38 +1461,29 @@ class AdbGripperApp(ctk.CTk):
         self.show_uninstall_confirmation(selected_packages)
 
 
-    def show_uninstall_confirmation(self, selected_packages):
-        """Shows the custom CTkTopLevel confirmation dialog before uninstalling."""
+    def _ensure_confirmation_dialog(self):
+        """
+        Creates the uninstall confirmation dialog on first use. The dialog is hidden (withdrawn)
+        instead of destroyed when it closes, so later confirmations only update its contents.
+        """
         if self.confirmation_dialog is not None and self.confirmation_dialog.winfo_exists():
-            # Dialog is already open, bring it to front if needed or do nothing
-            self.confirmation_dialog.lift()
-            self.confirmation_dialog.focus_force()
             return
 
         # Create the custom top-level dialog window
         self.confirmation_dialog = ctk.CTkToplevel(self)
         self.confirmation_dialog.title("Confirm Uninstallation")
         self.confirmation_dialog.geometry("400x400") # Adjust size as needed
-        
+        # Closing the window with the title bar button behaves like Cancel (and keeps the dialog for reuse)
+        self.confirmation_dialog.protocol("WM_DELETE_WINDOW", self._cancel_uninstall)
+
         # Configure grid for the dialog window
         self.confirmation_dialog.grid_columnconfigure(0, weight=1)
-        self.confirmation_dialog.grid_rowconfigure(0, weight=0) # Warning row
-        self.confirmation_dialog.grid_rowconfigure(1, weight=0) # Info text row
+        self.confirmation_dialog.grid_rowconfigure((0, 1, 3), weight=0) # Warning row, Info text row, Buttons row
         self.confirmation_dialog.grid_rowconfigure(2, weight=1) # App list area (takes space)
-        self.confirmation_dialog.grid_rowconfigure(3, weight=0) # Buttons row
 
-        # Determine the warning message based on whether system apps are potentially included
-        current_filter = self.app_filter_button.get()
-        is_all_apps_filter = (current_filter == "All Apps")
-
-        warning_text = ""
-        warning_color = "orange" # Default for user apps
-        if is_all_apps_filter:
-             warning_text = "WARNING: You are attempting to uninstall SYSTEM apps. This can seriously DAMAGE or BRICK your device!"
-             warning_color = "red"
-
-        # Add warning label to dialog
-        ctk.CTkLabel(self.confirmation_dialog, text=warning_text, text_color=warning_color, font=ctk.CTkFont(weight="bold"), wraplength=350).grid(row=0, column=0, padx=20, pady=(10, 5), sticky="ew")
+        # Add warning label to dialog (text and color depend on the app filter, set in show_uninstall_confirmation)
+        self._conf_warning_label = ctk.CTkLabel(self.confirmation_dialog, text="", font=self.bold_font, wraplength=350)
+        self._conf_warning_label.grid(row=0, column=0, padx=20, pady=(10, 5), sticky="ew")
 
         # Add informative text
         ctk.CTkLabel(self.confirmation_dialog, text="Are you sure you want to uninstall or disable the following applications?", wraplength=350).grid(row=1, column=0, padx=20, pady=(0, 10), sticky="ew")
@@ -1002,19 +1491,16 @@ class AdbGripperApp(ctk.CTk):
 
         # Add a Textbox or Scrollable Frame to list the selected packages
         # Using a Textbox is simpler for just displaying text
-        package_list_text = "\n".join(selected_packages)
-        package_list_textbox = ctk.CTkTextbox(self.confirmation_dialog, wrap="word", activate_scrollbars=True)
-        package_list_textbox.insert("0.0", package_list_text) # Insert text at the beginning
-        package_list_textbox.configure(state="disabled") # Make it read-only
-        package_list_textbox.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="nsew") # Takes remaining space
+        self._conf_textbox = ctk.CTkTextbox(self.confirmation_dialog, wrap="word", activate_scrollbars=True)
+        self._conf_textbox.configure(state="disabled") # Make it read-only
+        self._conf_textbox.grid(row=2, column=0, padx=20, pady=(0, 10), sticky="nsew") # Takes remaining space
 
 
         # Add buttons frame to dialog
         button_frame = ctk.CTkFrame(self.confirmation_dialog, fg_color="transparent")
         button_frame.grid(row=3, column=0, padx=20, pady=(0, 10), sticky="ew")
         button_frame.grid_columnconfigure(0, weight=1) # Spacer
-        button_frame.grid_columnconfigure(1, weight=0) # Cancel button
-        button_frame.grid_columnconfigure(2, weight=0) # Confirm button
+        button_frame.grid_columnconfigure((1, 2), weight=0) # Cancel button, Confirm button
 
         # Add Cancel and Confirm buttons to the button frame
         ctk.CTkButton(button_frame, text="Cancel", command=self._cancel_uninstall).grid(row=0, column=1, padx=(0, 10))
@@ -1022,39 +1508,82 @@ class AdbGripperApp(ctk.CTk):
 
         # Apply modal behavior *after* widgets are created to avoid rendering issues (black screen)
         self.confirmation_dialog.transient(self) # Keep dialog on top of main window
+
+
+    def show_uninstall_confirmation(self, selected_packages):
+        """Shows the custom CTkTopLevel confirmation dialog before uninstalling."""
+        if (self.confirmation_dialog is not None and self.confirmation_dialog.winfo_exists()
+                and self.confirmation_dialog.state() != "withdrawn"):
+            # Dialog is already open, bring it to front if needed or do nothing
+            self.confirmation_dialog.lift()
+            self.confirmation_dialog.focus_force()
+            return
+
+        self._ensure_confirmation_dialog()
+
+        # Determine the warning message based on whether system apps are potentially included
+        current_filter = self.app_filter_button.get()
+        is_all_apps_filter = (current_filter == "All Apps")
+
+        warning_text = ""
+        warning_color = "orange" # Default for user apps
+        if is_all_apps_filter:
+             warning_text = "WARNING: You are attempting to uninstall SYSTEM apps. This can seriously DAMAGE or BRICK your device!"
+             warning_color = "red"
+        self._conf_warning_label.configure(text=warning_text, text_color=warning_color)
+
+        # Replace the listed packages. Only the first ones are listed: laying out hundreds of lines
+        # in the Textbox is slow, and the full selection is still what gets uninstalled.
+        package_list_text = "\n".join(selected_packages[:self.CONFIRMATION_MAX_LISTED])
+        if len(selected_packages) > self.CONFIRMATION_MAX_LISTED:
+            package_list_text += f"\n...and {len(selected_packages) - self.CONFIRMATION_MAX_LISTED} more"
+        self._conf_textbox.configure(state="normal")
+        self._conf_textbox.delete("0.0", "end")
+        self._conf_textbox.insert("0.0", package_list_text) # Insert text at the beginning
+        self._conf_textbox.configure(state="disabled") # Make it read-only again
+
+        self.confirmation_dialog.deiconify() # Show it again if it was hidden
         self.confirmation_dialog.lift()   # Bring to front
-        
+
         # Use a delayed call to grab_set to ensure the window is mapped and painted
         # This fixes the "black window" issue on some Linux/Wayland configurations
-        def _make_modal():
-            if self.confirmation_dialog and self.confirmation_dialog.winfo_exists():
-                self.confirmation_dialog.grab_set()
-                self.confirmation_dialog.focus_force()
-        
-        self.after(200, _make_modal)
+        self.after(200, self._make_confirmation_modal)
+
+
+    def _make_confirmation_modal(self):
+        """Grabs input for the confirmation dialog once it is mapped (see show_uninstall_confirmation)."""
+        if (self.confirmation_dialog and self.confirmation_dialog.winfo_exists()
+                and self.confirmation_dialog.state() != "withdrawn"):
+            self.confirmation_dialog.grab_set()
+            self.confirmation_dialog.focus_force()
+
+
+    def _hide_confirmation_dialog(self):
+        """Hides the confirmation dialog, keeping it for the next confirmation."""
+        if self.confirmation_dialog is not None and self.confirmation_dialog.winfo_exists():
+            self.confirmation_dialog.grab_release()
+            self.confirmation_dialog.withdraw()
 
 
     def _confirm_uninstall(self):
         """Callback for the Confirm button in the custom dialog."""
-        if self.confirmation_dialog is not None:
-            self.confirmation_dialog.destroy() # Close the dialog window
-            self.confirmation_dialog = None # Clear the reference
+        self._hide_confirmation_dialog() # Close the dialog window
 
         # Trigger the actual uninstall process in a separate thread
         # Use the stored list of packages
-        if self.current_device_serial and self.adb_manager.adb_available and self._packages_to_uninstall_in_dialog:
+        # The rows (and so the selection) must belong to the selected device
+        if (self.current_device_serial and self.current_device_serial == self._app_list_serial
+                and self.adb_manager.adb_available and self._packages_to_uninstall_in_dialog):
              self.update_status(f"Confirmation received. Starting uninstall process for {len(self._packages_to_uninstall_in_dialog)} app(s)...", level="info")
-             threading.Thread(target=self._perform_uninstall_threaded, args=(self.current_device_serial, self._packages_to_uninstall_in_dialog), daemon=True).start()
+             self._pool.submit(self._perform_uninstall_threaded, self.current_device_serial, self._packages_to_uninstall_in_dialog)
         else:
              self.update_status("Device disconnected, ADB not available, or no packages to uninstall. Cannot perform uninstall.", level="error")
-             self._packages_to_uninstall_in_dialog = [] # Clear the stored list
+        self._packages_to_uninstall_in_dialog = [] # Clear the stored list (the thread keeps its own reference)
 
 
     def _cancel_uninstall(self):
         """Callback for the Cancel button in the custom dialog."""
-        if self.confirmation_dialog is not None:
-            self.confirmation_dialog.destroy() # Close the dialog window
-            self.confirmation_dialog = None # Clear the reference
+        self._hide_confirmation_dialog() # Close the dialog window
 
         self.update_status("Uninstallation cancelled by user.", level="info")
         self._packages_to_uninstall_in_dialog = [] # Clear the stored list
@@ -1062,96 +1591,98 @@ class AdbGripperApp(ctk.CTk):
 
     def _perform_uninstall_threaded(self, serial, packages_to_uninstall):
         """Performs the uninstall/disable command(s) for selected packages in a thread."""
-        # Disable GUI controls during the uninstall process using self.after() via lambda
-        self.after(0, lambda: self.enable_functionality_widgets(False)) # Disable main controls
-        self.after(0, lambda: self.refresh_app_list_button.configure(state="disabled")) # Specifically disable refresh list btn
-        self.after(0, lambda: self.uninstall_selected_button.configure(state="disabled")) # Specifically disable uninstall btn
+        # Disable GUI controls during the uninstall process (on the main GUI thread)
+        self.after(0, self._begin_uninstall_gui)
 
 
         results = {} # To store results for each package {package_name: "success" | "disabled" | "failed"}
         total_packages = len(packages_to_uninstall)
 
-        for i, package_name in enumerate(packages_to_uninstall):
-            # Update status bar with progress for the specific package using lambda
-            self.after(0, lambda msg=f"[{i+1}/{total_packages}] Processing {package_name}...", lvl="info": self.update_status(msg, level=lvl))
-
-            # Try uninstalling first
-            uninstall_success = self.adb_manager.uninstall_package(serial, package_name)
-
-            if uninstall_success:
-                results[package_name] = "success"
-                self.after(0, lambda pkg=package_name, res="success": self._handle_uninstall_result_gui(pkg, res))
-            else:
-                # Uninstall failed, attempt to disable
-                self.after(0, lambda msg=f"[{i+1}/{total_packages}] Uninstall failed for {package_name}. Attempting to disable...", lvl="warning": self.update_status(msg, level=lvl))
-                disable_success = self.adb_manager.disable_package(serial, package_name)
-
-                if disable_success:
-                    results[package_name] = "disabled"
-                    self.after(0, lambda pkg=package_name, res="disabled": self._handle_uninstall_result_gui(pkg, res))
-                else:
-                    results[package_name] = "failed" # Failed both uninstall and disable
-                    self.after(0, lambda pkg=package_name, res="failed": self._handle_uninstall_result_gui(pkg, res))
-
-        # All packages processed
-        self.after(0, lambda: self.update_status("Uninstallation process complete.", level="info"))
-        # Re-enable GUI controls and refresh the app list using lambda
-        self.after(0, lambda: self.enable_functionality_widgets(True)) # Re-enable main controls
-        self.after(0, self.list_apps_in_gui) # Refresh the app list to reflect changes
-
-
-    def _handle_uninstall_result_gui(self, package_name, result_status):
-        """Handles the result of a single uninstall/disable attempt and updates the GUI list display."""
-        # This method runs on the main GUI thread (via self.after).
-
-        # Find the checkbox widget for the processed package
-        if package_name in self.app_checkboxes:
-            checkbox = self.app_checkboxes[package_name]
-
-            # Update the checkbox text/color to indicate the result
-            if result_status == "success":
-                checkbox.configure(text=f"{package_name} (Uninstalled)", text_color="green", state="disabled")
-            elif result_status == "disabled":
-                checkbox.configure(text=f"{package_name} (Disabled)", text_color="orange", state="disabled")
-            elif result_status == "failed":
-                 checkbox.configure(text=f"{package_name} (Failed)", text_color="red", state="disabled")
-
-            # Uncheck the box after processing (it's also disabled, but good practice)
-            checkbox.select(0)
-
-        # The final list_apps_in_gui call will refresh the entire list, removing
-        # uninstalled apps and showing disabled ones (if the filter allows).
-        # The visual status update above provides immediate feedback during the process.
-
-        # Re-evaluate the uninstall button state after each attempt (in case the last selected was removed)
-        # This happens via the final enable_functionality_widgets and list_apps_in_gui calls.
-        pass # No need to call _on_app_checkbox_changed here per item anymore
+        # All packages go to the device as one script (uninstall, falling back to disabling, e.g. system apps);
+        # results stream back one package at a time, so progress is still shown per package
+        self.update_status(f"Processing {total_packages} package(s)...", level="info")
+        for i, (package_name, result) in enumerate(self.adb_manager.remove_packages_iter(serial, packages_to_uninstall)):
+            results[package_name] = result # "success" | "disabled" | "failed"
+            # Update status bar with progress for the specific package (update_status is thread-safe)
+            self.update_status(f"[{i+1}/{total_packages}] {package_name}: {result}", level="info" if result != "failed" else "warning")
+            # Results are queued and marked on the list in batches (at most one flush pending at a time)
+            self._uninstall_results.append((serial, package_name, result))
+            if not self._uninstall_flush_scheduled:
+                self._uninstall_flush_scheduled = True
+                self.after(self.UNINSTALL_FLUSH_DELAY_MS, self._flush_uninstall_results)
+
+        # All packages processed; cached lists of this device are outdated now
+        self._invalidate_app_list_cache(serial)
+        self.update_status("Uninstallation process complete.", level="info")
+        # Only an actual uninstall removes rows; disabled packages are still listed and just keep their marking
+        removed_any = "success" in results.values()
+        self.after(0, self._finish_uninstall_gui, serial, removed_any)
+
+
+    def _begin_uninstall_gui(self):
+        """Disables the controls for the duration of an uninstall run (runs on the main GUI thread)."""
+        self.enable_functionality_widgets(False) # Disable main controls
+        self.refresh_app_list_button.configure(state="disabled") # Specifically disable refresh list btn
+        self.uninstall_selected_button.configure(state="disabled") # Specifically disable uninstall btn
+
+
+    def _flush_uninstall_results(self):
+        """Marks every queued uninstall/disable result on the app list (runs on the main GUI thread)."""
+        # The flag is cleared before draining, so a result queued meanwhile is either drained here or schedules a new flush
+        self._uninstall_flush_scheduled = False
+        changed_rows = set()
+        while self._uninstall_results:
+            serial, package_name, result_status = self._uninstall_results.popleft()
+            # Find the row of the processed package (only if the list still shows that device)
+            i = self._pkg_index.get(package_name) if serial == self._app_list_serial else None
+            if i is not None and result_status in self.APP_RESULT_LABELS:
+                # Mark the row with the result; it is drawn in the result's color and can no longer be selected
+                self._pkg_results[i] = result_status
+                # Uncheck the row after processing
+                self._selected_packages.discard(package_name)
+                changed_rows.add(i)
+
+        # Only the changed rows on screen are drawn now; the others pick up their result when scrolled into view
+        for i in self._visible_app_rows():
+            if i in changed_rows:
+                self._draw_app_row(i)
+
+
+    def _finish_uninstall_gui(self, serial, removed_any):
+        """
+        Re-enables the controls after an uninstall run, on the main GUI thread.
+        Args: serial: The device the packages were removed from.
+              removed_any: True if at least one package was uninstalled (the list is then refreshed).
+        """
+        self._flush_uninstall_results() # Results still queued
+        # The user may have selected another device (or none) meanwhile; its controls and list are managed by on_device_selected
+        if serial != self.current_device_serial:
+            return
+        self.enable_functionality_widgets(True) # Re-enable main controls
+        if removed_any:
+            self.list_apps_in_gui() # Refresh the app list to drop the uninstalled apps
+        else:
+            # Nothing left the list: the marked rows stay, only the selection buttons need their state back
+            self._on_app_checkbox_changed()
 
 
     # --- App Details Method ---
+    @_require_device
     def view_app_details(self):
         """Fetches and displays details for the single selected app."""
         # Identify the selected package
-        selected_package = None
-        for pkg, checkbox in self.app_checkboxes.items():
-            if checkbox.get() == 1:
-                selected_package = pkg
-                break
-        
-        if not selected_package: return
+        selected_package = next(iter(self._selected_packages), None)
 
-        if not self.current_device_serial or not self.adb_manager.adb_available:
-            self.update_status("Device not connected.", level="error")
-            return
+        if not selected_package: return
 
         self.update_status(f"Fetching details for {selected_package}...", level="info")
         
         # Run in thread
-        threading.Thread(target=self._perform_get_details_threaded, args=(self.current_device_serial, selected_package), daemon=True).start()
+        self._pool.submit(self._perform_get_details_threaded, self.current_device_serial, selected_package)
 
     def _perform_get_details_threaded(self, serial, package_name):
         details = self.adb_manager.get_package_details(serial, package_name)
-        self.after(0, lambda d=details: self._show_details_popup(d))
+        self.after(0, self._show_details_popup, details)
 
     def _show_details_popup(self, details):
         if not details:
@@ -1178,33 +1709,58 @@ class AdbGripperApp(ctk.CTk):
             ('last_update_time', 'Last Update:'),
             ('uid', 'UID:'),
         ]:
-            ctk.CTkLabel(popup, text=label_text, font=ctk.CTkFont(weight="bold")).grid(row=row, column=0, padx=10, pady=5, sticky="e")
+            ctk.CTkLabel(popup, text=label_text, font=self.bold_font).grid(row=row, column=0, padx=10, pady=5, sticky="e")
             ctk.CTkLabel(popup, text=details.get(key, 'N/A'), anchor="w").grid(row=row, column=1, padx=10, pady=5, sticky="ew")
             row += 1
 
         # Permissions list
-        ctk.CTkLabel(popup, text="Permissions:", font=ctk.CTkFont(weight="bold")).grid(row=row, column=0, padx=10, pady=5, sticky="ne")
+        ctk.CTkLabel(popup, text="Permissions:", font=self.bold_font).grid(row=row, column=0, padx=10, pady=5, sticky="ne")
         
-        perms_textbox = ctk.CTkTextbox(popup, height=150)
-        perms_textbox.grid(row=row, column=1, padx=10, pady=5, sticky="nsew")
+        # A plain Listbox holds one lightweight item per permission (no text layout, unlike a Textbox)
+        perms_frame = ctk.CTkFrame(popup)
+        perms_frame.grid(row=row, column=1, padx=10, pady=5, sticky="nsew")
+        perms_frame.grid_columnconfigure(0, weight=1)
+        perms_frame.grid_rowconfigure(0, weight=1)
         popup.grid_rowconfigure(row, weight=1)
-        
-        perms_text = "\n".join(details.get('permissions', []))
-        perms_textbox.insert("0.0", perms_text)
-        perms_textbox.configure(state="disabled")
+
+        perms_listbox = tk.Listbox(perms_frame, height=8, borderwidth=0, highlightthickness=0, activestyle="none",
+                                   bg=self._theme_color("CTkTextbox", "fg_color"),
+                                   fg=self._theme_color("CTkTextbox", "text_color"))
+        perms_listbox.grid(row=0, column=0, sticky="nsew", padx=(5, 0), pady=5)
+        perms_scrollbar = ctk.CTkScrollbar(perms_frame, command=perms_listbox.yview)
+        perms_scrollbar.grid(row=0, column=1, sticky="ns", pady=5)
+        # The first PERMISSIONS_PAGE_SIZE permissions are shown right away; more are added as the list is scrolled to its end
+        permissions = details.get('permissions', [])
+        perms_listbox.configure(yscrollcommand=functools.partial(self._on_permissions_scrolled, perms_listbox, perms_scrollbar, permissions))
+        self._load_more_permissions(perms_listbox, permissions)
 
         self.update_status(f"Details shown for {details['package_name']}.", level="info")
 
 
+    def _load_more_permissions(self, listbox, permissions):
+        """Adds the next PERMISSIONS_PAGE_SIZE permissions to a details popup's listbox (all of the page in one call)."""
+        if not listbox.winfo_exists():
+            return # The popup was closed meanwhile
+        shown = listbox.size()
+        if shown < len(permissions):
+            listbox.insert("end", *permissions[shown:shown + self.PERMISSIONS_PAGE_SIZE])
+
+
+    def _on_permissions_scrolled(self, listbox, scrollbar, permissions, first, last):
+        """yscrollcommand of a permissions listbox: moves the scrollbar and loads more permissions near the end of the list."""
+        scrollbar.set(first, last)
+        if float(last) >= 0.95 and listbox.size() < len(permissions):
+            # Deferred: the listbox is still in the middle of updating its view
+            self.after_idle(self._load_more_permissions, listbox, permissions)
+
+
     # --- Logcat Methods ---
     def start_logcat_gui(self):
         if not self.current_device_serial:
             self.update_status("No device selected.", level="error")
             return
         
-        self.logcat_textbox.configure(state="normal") # clear logic needs this
         # self.logcat_textbox.delete("0.0", "end") # Optional: auto-clear on start
-        self.logcat_textbox.configure(state="disabled")
 
         self.logcat_start_button.configure(state="disabled")
         self.logcat_stop_button.configure(state="normal")
@@ -1213,34 +1769,98 @@ class AdbGripperApp(ctk.CTk):
 
     def stop_logcat_gui(self):
         self.adb_manager.stop_logcat()
+        # A drain still scheduled moves what is already queued into the textbox
         self.logcat_start_button.configure(state="normal")
         self.logcat_stop_button.configure(state="disabled")
 
-    def update_logcat_gui(self, line):
-        # This is called from a thread, so use after
-        self.after(0, lambda l=line: self._append_logcat_line(l))
-
-    def _append_logcat_line(self, line):
-        self.logcat_textbox.configure(state="normal")
-        self.logcat_textbox.insert("end", line)
-        self.logcat_textbox.see("end") # Auto-scroll
-        self.logcat_textbox.configure(state="disabled")
+    def update_logcat_gui(self, lines):
+        # Called from the logcat thread with a batch of lines; only queued here, the main loop picks it up.
+        # The lines are classified by level here, off the GUI thread, into runs of consecutive lines
+        # sharing a tag, so the drain inserts one run at a time instead of one line at a time.
+        runs = []
+        run_lines = []
+        run_tag = None
+        level_match = _LOGCAT_LEVEL_RE.match
+        for line in lines:
+            match = level_match(line)
+            tag = _LOGCAT_LEVEL_TAGS.get(match.group(1)) if match else None
+            if tag != run_tag and run_lines:
+                runs.append(("\n".join(run_lines) + "\n", run_tag)) # Lines come without newlines, so each one gets its own
+                run_lines = []
+            run_tag = tag
+            run_lines.append(line)
+        if run_lines:
+            runs.append(("\n".join(run_lines) + "\n", run_tag))
+
+        # The first batch after a drain schedules the next one; later batches just join the queue.
+        self._logcat_queue.append((lines, runs))
+        if not self._logcat_drain_scheduled:
+            self._logcat_drain_scheduled = True
+            self.after(self.LOGCAT_DRAIN_DELAY_MS, self._drain_logcat)
+
+    def _drain_logcat(self):
+        # Everything queued since the drain was scheduled goes into the textbox, one insert per run of equally tagged lines.
+        # The flag is cleared before draining: a batch queued meanwhile is either drained
+        # here or schedules a new drain, so nothing is left behind.
+        self._logcat_drain_scheduled = False
+        runs = []
+        while self._logcat_queue:
+            lines, batch_runs = self._logcat_queue.popleft()
+            self._logcat_lines.extend(lines)
+            for text, tag in batch_runs:
+                if runs and runs[-1][1] == tag:
+                    runs[-1][0].append(text) # Same tag as the previous run (e.g. across batches): merge
+                else:
+                    runs.append(([text], tag))
+        if runs:
+            self._append_logcat_runs([("".join(texts), tag) for texts, tag in runs])
+
+    def _append_logcat_runs(self, runs):
+        # runs: list of (text, tag or None), text ending with a newline
+        # Follow new lines only if the view is at the bottom; a user scrolled up to read stays where they are
+        follow = self.logcat_textbox.yview()[1] >= 0.999
+        for text, tag in runs:
+            self.logcat_textbox.insert("end", text, tag)
+        # Drop the oldest lines once the cap (plus slack) is exceeded; 'end-1c' is on the last line
+        line_count = int(self.logcat_textbox.index("end-1c").split(".")[0])
+        if line_count > self.MAX_LOGCAT_LINES + self.LOGCAT_TRIM_SLACK:
+            self.logcat_textbox.delete("1.0", f"{line_count - self.MAX_LOGCAT_LINES}.0")
+            # Trim the saved lines by the same number of lines
+            for _ in range(line_count - self.MAX_LOGCAT_LINES - 1):
+                self._logcat_lines.popleft()
+        if follow:
+            self.logcat_textbox.see("end") # Auto-scroll
+
+    def _block_logcat_edit(self, event):
+        # Keeps the logcat textbox read-only: navigation keys and Ctrl/Cmd+C, Ctrl/Cmd+A pass, everything that edits is dropped
+        if event.type == tk.EventType.KeyPress:
+            if event.keysym in self._LOGCAT_NAVIGATION_KEYS:
+                return None
+            # Control (0x4) held, or Mod1 (0x8), which is how Tk reports Command on macOS
+            if event.state & (0x4 | 0x8) and event.keysym.lower() in ("c", "a"):
+                return None
+        return "break"
 
     def clear_logcat_gui(self):
-        self.logcat_textbox.configure(state="normal")
         self.logcat_textbox.delete("0.0", "end")
-        self.logcat_textbox.configure(state="disabled")
+        self._logcat_lines.clear()
 
     def save_logcat_gui(self):
         file_path = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=[("Text files", "*.txt")])
         if file_path:
-            try:
-                content = self.logcat_textbox.get("0.0", "end")
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(content)
-                self.update_status(f"Logcat saved to {os.path.basename(file_path)}", level="info")
-            except Exception as e:
-                self.update_status(f"Error saving logcat: {e}", level="error")
+            # Snapshot the line list (no textbox dump, the strings themselves are shared, not copied)
+            # and write it from a thread, so the GUI never waits on the disk
+            lines = list(self._logcat_lines)
+            self._pool.submit(self._save_logcat_threaded, file_path, lines)
+
+    def _save_logcat_threaded(self, file_path, lines):
+        try:
+            # Streamed line by line through a 1 MiB buffer; no single string of the whole log is built
+            with open(file_path, "w", encoding="utf-8", newline="\n", buffering=1 << 20) as f:
+                f.writelines(line + "\n" for line in lines)
+            self.update_status(f"Logcat saved to {os.path.basename(file_path)}", level="info")
+        except Exception as e:
+            self.update_status(f"Error saving logcat: {e}", level="error")
 
 
 # --- Run the application ---